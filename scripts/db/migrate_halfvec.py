@@ -0,0 +1,71 @@
+from sqlalchemy import create_engine, text
+import time
+
+from dotenv import load_dotenv
+import os
+from pathlib import Path
+
+# (table, vector column, HNSW index) converted from vector(1536) to halfvec(1536)
+# NOTE: the HNSW indexes are built with vector_cosine_ops, which doesn't apply to halfvec,
+# so each index is dropped before the column type changes and rebuilt with halfvec_cosine_ops afterwards.
+HALFVEC_COLUMNS = [
+    ("text_embeddings", "embedding_vector", "idx_text_embeddings_vector_cosine"),
+    ("interpersonal_relationships", "relationship_vector", "idx_interpersonal_vector_cosine"),
+]
+
+def migrate_to_halfvec(engine):
+    # warn users if they don't want to commit this action
+    print(
+        """
+        CONVERTING EMBEDDING COLUMNS TO HALFVEC IN THE MAIN DB IN 3 SEC...
+        REQUIRES pgvector >= 0.7.0. PLEASE ABORT NOW IF YOU'D LIKE TO STOP!!!
+        """
+    )
+    time.sleep(3)
+
+    for table_name, column_name, index_name in HALFVEC_COLUMNS:
+        print(f"Converting {table_name}.{column_name} to halfvec(1536)...")
+        # one transaction per table, so a failure leaves that table's column and index untouched
+        with engine.begin() as conn:
+            conn.execute(text(f"DROP INDEX IF EXISTS {index_name};"))
+            conn.execute(text(
+                f"ALTER TABLE {table_name} "
+                f"ALTER COLUMN {column_name} TYPE halfvec(1536) USING {column_name}::halfvec(1536);"
+            ))
+            conn.execute(text(
+                f"CREATE INDEX {index_name} ON {table_name} "
+                f"USING hnsw ({column_name} halfvec_cosine_ops) WITH (m = 16, ef_construction = 64);"
+            ))
+        print(f"Converted {table_name}.{column_name} and rebuilt {index_name}")
+
+if __name__ == "__main__":
+    # one-off script to migrate existing embedding columns to halfvec (new tables are created as halfvec already)
+
+    # load in the proper .env file, defaulted to .env.dev
+    APP_ENV = os.getenv("APP_ENV", "dev")
+    # Define the path to the .env file relative to this config file's location.
+    # This file is in scripts/db/, so we go up two levels to project root
+    SERVICE_ROOT = Path(__file__).resolve().parents[2]
+    env_file_path = SERVICE_ROOT / f".env.{APP_ENV}"
+
+    # Load the .env file manually
+    print(f"Loading env file from: {env_file_path}")
+    load_dotenv(dotenv_path=env_file_path)
+
+    MAIN_DB_USER = os.getenv("MAIN_DB_USER")
+    MAIN_DB_PW = os.getenv("MAIN_DB_PW")
+    MAIN_DB_HOST = os.getenv("MAIN_DB_HOST")
+    MAIN_DB_PORT = os.getenv("MAIN_DB_PORT")
+    MAIN_DB_NAME = os.getenv("MAIN_DB_NAME")
+
+    MAIN_DB_URL = f"postgresql+psycopg2://{MAIN_DB_USER}:{MAIN_DB_PW}@{MAIN_DB_HOST}:{MAIN_DB_PORT}/{MAIN_DB_NAME}?sslmode=require"
+
+    assert MAIN_DB_URL, "MAIN_DB_URL is not set"
+
+    try:
+        engine = create_engine(MAIN_DB_URL)
+    except Exception as e:
+        print(f"Error connecting to database: {e}")
+        exit(1)
+
+    migrate_to_halfvec(engine)
@@ -0,0 +1,69 @@
+from sqlalchemy import create_engine, text
+import time
+
+from dotenv import load_dotenv
+import os
+from pathlib import Path
+
+from portable_brain.common.db.models.memory.people import SEARCH_VECTOR_MAX_CHARS
+
+# NOTE: a stored generated column's expression can't be altered in place (before PG17), so the column is dropped and re-added.
+# Re-adding it rewrites the table and computes the new expression for every existing row, so no backfill UPDATE is needed.
+# Dropping the column also drops its GIN index, which is rebuilt unchanged afterwards.
+SEARCH_VECTOR_EXPRESSION = (
+    f"setweight(to_tsvector('english', left(relationship_description, {SEARCH_VECTOR_MAX_CHARS})), 'A')"
+)
+
+def migrate_search_vector(engine):
+    # warn users if they don't want to commit this action
+    print(
+        """
+        REBUILDING interpersonal_relationships.search_vector IN THE MAIN DB IN 3 SEC...
+        PLEASE ABORT NOW IF YOU'D LIKE TO STOP!!!
+        """
+    )
+    time.sleep(3)
+
+    # single transaction, so a failure leaves the old column and index in place
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE interpersonal_relationships DROP COLUMN IF EXISTS search_vector;"))
+        conn.execute(text(
+            "ALTER TABLE interpersonal_relationships "
+            f"ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ({SEARCH_VECTOR_EXPRESSION}) STORED;"
+        ))
+        conn.execute(text(
+            "CREATE INDEX idx_interpersonal_search_vector ON interpersonal_relationships USING gin (search_vector);"
+        ))
+    print("Rebuilt interpersonal_relationships.search_vector and idx_interpersonal_search_vector")
+
+if __name__ == "__main__":
+    # one-off script to migrate the existing search_vector column (new tables are created with the new expression already)
+
+    # load in the proper .env file, defaulted to .env.dev
+    APP_ENV = os.getenv("APP_ENV", "dev")
+    # Define the path to the .env file relative to this config file's location.
+    # This file is in scripts/db/, so we go up two levels to project root
+    SERVICE_ROOT = Path(__file__).resolve().parents[2]
+    env_file_path = SERVICE_ROOT / f".env.{APP_ENV}"
+
+    # Load the .env file manually
+    print(f"Loading env file from: {env_file_path}")
+    load_dotenv(dotenv_path=env_file_path)
+
+    MAIN_DB_USER = os.getenv("MAIN_DB_USER")
+    MAIN_DB_PW = os.getenv("MAIN_DB_PW")
+    MAIN_DB_HOST = os.getenv("MAIN_DB_HOST")
+    MAIN_DB_PORT = os.getenv("MAIN_DB_PORT")
+    MAIN_DB_NAME = os.getenv("MAIN_DB_NAME")
+
+    MAIN_DB_URL = f"postgresql+psycopg2://{MAIN_DB_USER}:{MAIN_DB_PW}@{MAIN_DB_HOST}:{MAIN_DB_PORT}/{MAIN_DB_NAME}?sslmode=require"
+
+    assert MAIN_DB_URL, "MAIN_DB_URL is not set"
+
+    try:
+        engine = create_engine(MAIN_DB_URL)
+    except Exception as e:
+        print(f"Error connecting to database: {e}")
+        exit(1)
+
+    migrate_search_vector(engine)
@@ -1,4 +1,5 @@
 # prompts for executing commands on device via tool calling
+import sys
 
 class DeviceExecutionPrompts():
     """
@@ -397,3 +398,7 @@ class DeviceExecutionPrompts():
 
     Remember: Always call execute_command to interact with the device. Use the appended context to resolve ambiguity and enrich your commands. Never guess or fabricate details not present in the request or context. Always produce valid JSON matching the ExecutionLLMOutput schema as your final response.
     """
+
+    # NOTE: interned once at import, so every agent call (and any prompt-keyed cache) shares the same string object
+    direct_execution_system_prompt = sys.intern(direct_execution_system_prompt)
+    device_execution_system_prompt = sys.intern(device_execution_system_prompt)
@@ -1,4 +1,5 @@
 # prompts for memory retrieval agent via tool calling
+import sys
 
 class MemoryRetrievalPrompts():
     """
@@ -50,6 +51,9 @@ class MemoryRetrievalPrompts():
     - find_similar_person_relationships(query, limit?) → Semantic search over relationship descriptions. Use when you need to find people by the nature of their relationship (e.g., "close friend from work", "person user messages on Instagram").
     - get_person_by_id(person_id) → Direct lookup of a person's full relationship record by their unique ID. Use only when you already have the exact ID.
 
+    Batch:
+    - batch_memory_query(queries) → Runs several of the tools above concurrently in a single tool call. Each item is {"tool": <tool name>, "params": {<that tool's arguments>}}; results come back in the same order. Prefer this whenever you need two or more lookups whose inputs do not depend on each other's results.
+
     RETRIEVAL STATE (for multi-turn re-retrieval)
     When invoked for re-retrieval after a failed execution, you will receive a retrieval_state JSON object appended to the user request. Its schema is:
     {
@@ -335,13 +339,17 @@ class MemoryRetrievalPrompts():
     - RE-RETRIEVAL: A previous execution attempt failed. You receive a retrieval_state (described below) containing what was already tried and why it failed. Use this to make targeted follow-up queries that address the gap.
 
     TOOLS AVAILABLE (Memory Retrieval)
-    You have access to two retrieval tools:
+    You have access to two retrieval tools, plus a batch tool to run several of them at once:
 
     - find_semantically_similar(query, limit?, distance_metric?) → Semantic similarity search across all embedded observations using natural language. Embedding is handled internally. Returns the most semantically relevant observations regardless of memory type (people, preferences, content, etc.).
     - find_person_by_name(name, similarity_threshold?, limit?) → Fuzzy name lookup against interpersonal relationship records using trigram similarity. Use this when the user mentions a person by name — handles typos, nicknames, and partial names (e.g. "Jon" matches "John Smith").
 
     Use find_person_by_name when you need to resolve a person's identity from a name. Use find_semantically_similar for everything else, including relationship-type queries or when name-based lookup returns nothing.
 
+    - batch_memory_query(queries) → Runs several find_semantically_similar / find_person_by_name calls concurrently in a single tool call. Each item is {"tool": <tool name>, "params": {<that tool's arguments>}}; results come back in the same order.
+
+    Prefer batch_memory_query whenever you need two or more lookups whose inputs do not depend on each other's results — it saves a full round trip per extra lookup. Only make separate calls when a later query depends on an earlier result (e.g. a follow-up query built from what a previous search returned). In retrieval_log, record each query inside a batch as its own entry under its underlying tool name.
+
     RETRIEVAL STATE (for multi-turn re-retrieval)
     When invoked for re-retrieval after a failed execution, you will receive a retrieval_state JSON object appended to the user request. Its schema is:
     {
@@ -383,7 +391,7 @@ class MemoryRetrievalPrompts():
     - If this is a re-retrieval, check retrieval_state.previous_queries and DO NOT repeat the same query. Rephrase or approach from a different angle.
 
     3) Execute Queries
-    - Call the appropriate tool(s) as planned. For person name resolution use find_person_by_name; for everything else use find_semantically_similar. You may call either tool multiple times with different inputs if you need to resolve multiple gaps.
+    - Call the appropriate tool(s) as planned. For person name resolution use find_person_by_name; for everything else use find_semantically_similar. You may call either tool multiple times with different inputs if you need to resolve multiple gaps. Group independent calls into one batch_memory_query call.
     - After receiving results, evaluate: do you now have enough information for the execution agent?
         • If YES → proceed to step 4.
         • If NO → call the appropriate tool again with a differently worded query or lower similarity_threshold to fill the remaining gaps.
@@ -597,3 +605,7 @@ class MemoryRetrievalPrompts():
 
     Remember: Your output feeds directly into the execution agent. The quality of the execution depends entirely on the quality of your retrieval. Be thorough, be precise, and never guess.
     """
+
+    # NOTE: interned once at import, so every agent call (and any prompt-keyed cache) shares the same string object
+    memory_retrieval_system_prompt = sys.intern(memory_retrieval_system_prompt)
+    memory_retrieval_system_prompt_for_testing = sys.intern(memory_retrieval_system_prompt_for_testing)
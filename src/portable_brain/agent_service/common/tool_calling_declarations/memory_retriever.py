@@ -271,6 +271,54 @@ get_embedding_for_observation_declaration = {
     },
 }
 
+# =====================================================================
+# Batch — multiple retrieval calls in a single tool call
+# =====================================================================
+
+batch_memory_query_declaration = {
+    "name": "batch_memory_query",
+    "description": "Run several independent memory retrieval tool calls at once, concurrently. Prefer this over separate tool calls whenever you need more than one lookup whose inputs do not depend on each other's results. Returns a list with one entry per query, in order, each with keys: tool, params, and either result or error.",
+    "parameters": {
+        "type": "object",
+        "properties": {
+            "queries": {
+                "type": "array",
+                "description": "The retrieval calls to run. Each item names one of the other available retrieval tools and its arguments.",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "tool": {
+                            "type": "string",
+                            "description": "Name of the retrieval tool to call, e.g. 'find_semantically_similar'. Must not be 'batch_memory_query'.",
+                        },
+                        "params": {
+                            "type": "object",
+                            "description": "Arguments for the tool, exactly as for a direct call to it. Only set the arguments that tool accepts.",
+                            "properties": {
+                                "query": {"type": "string"},
+                                "name": {"type": "string"},
+                                "limit": {"type": "integer"},
+                                "distance_metric": {"type": "string"},
+                                "similarity_threshold": {"type": "number"},
+                                "person_id": {"type": "string"},
+                                "source_app_id": {"type": "string"},
+                                "source_id": {"type": "string"},
+                                "content_id": {"type": "string"},
+                                "entity_id": {"type": "string"},
+                                "entity_type": {"type": "string"},
+                                "memory_type": {"type": "string"},
+                                "observation_id": {"type": "string"},
+                            },
+                        },
+                    },
+                    "required": ["tool", "params"],
+                },
+            },
+        },
+        "required": ["queries"],
+    },
+}
+
 # aggregated list of all memory retriever declarations to be used by the agent
 memory_retriever_declarations = [
     get_people_relationships_declaration,
@@ -286,6 +334,8 @@ memory_retriever_declarations = [
     get_person_by_id_declaration,
     find_person_by_name_declaration,
     find_similar_person_relationships_declaration,
+    # batch
+    batch_memory_query_declaration,
 ]
 
 # placeholder for testing: only text log memory
@@ -302,4 +352,5 @@ memory_retriever_declarations_for_testing = [
     # get_person_by_id_declaration,
     find_person_by_name_declaration,
     # find_similar_person_relationships_declaration,
+    batch_memory_query_declaration,
 ]
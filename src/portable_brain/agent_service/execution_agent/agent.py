@@ -11,6 +11,9 @@ from portable_brain.agent_service.common.system_prompts.device_execution_prompts
 # LLM output schema
 from portable_brain.agent_service.common.types.llm_outputs.execution_outputs import ExecutionLLMOutput
 
+# declarations passed on every execution call; a single module-level object so the LLM client's tool cache is reused
+_EXEC_DECLS = (droidrun_execution_declaration,)
+
 class ExecutionAgent():
     """
     Main execution agent that tool calls to DroidRun client to execute commands on device.
@@ -28,6 +31,8 @@ class ExecutionAgent():
     Receives memory context and executes commands on device via tool calls to droidrun.
     NOTE: initialized during lifespan and reused in the service lifecycle.
     """
+    __slots__ = ("droidrun_client", "llm_client")
+
     def __init__(self, droidrun_client: DroidRunClient, gemini_llm_client: AsyncGenAITypedClient):
         self.droidrun_client = droidrun_client
         self.llm_client = gemini_llm_client # NOTE: for now, this llm client must be the gemini client (not dispatcher) to allow atool_call() method
@@ -45,7 +50,7 @@ class ExecutionAgent():
         return await self.llm_client.atool_call(
             system_prompt=test_system_prompt,
             user_prompt=user_prompt,
-            function_declarations=[droidrun_execution_declaration],
+            function_declarations=_EXEC_DECLS,
             tool_executors={"execute_command": self.droidrun_client.execute_command},
             max_turns=5
         )
@@ -55,7 +60,7 @@ class ExecutionAgent():
         return await self.llm_client.atool_call(
             system_prompt=DeviceExecutionPrompts.direct_execution_system_prompt,
             user_prompt=user_request,
-            function_declarations=[droidrun_execution_declaration],
+            function_declarations=_EXEC_DECLS,
             tool_executors={"execute_command": self.droidrun_client.execute_command},
             response_model=ExecutionLLMOutput,
             max_turns=max_turns,
@@ -67,13 +72,13 @@ class ExecutionAgent():
 
         Args: context is given as a plain natural language string, alongside the original user request.
         """
-        user_prompt = user_request + "\n\n Context: \n" + context
+        user_prompt = f"{user_request}\n\n Context: \n{context}"
         # or, make a new semantically enriched user prompt via LLM pass (TBD)
 
         return await self.llm_client.atool_call(
             system_prompt=DeviceExecutionPrompts.device_execution_system_prompt,
             user_prompt=user_prompt,
-            function_declarations=[droidrun_execution_declaration],
+            function_declarations=_EXEC_DECLS,
             tool_executors={"execute_command": self.droidrun_client.execute_command},
             response_model=ExecutionLLMOutput,
             max_turns=max_turns,
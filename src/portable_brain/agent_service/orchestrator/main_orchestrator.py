@@ -1,5 +1,7 @@
 # main orchestrator agent, a.k.a. the entrypoint for all agent logic
 # bridges between memory context retrieval layer and tool calling execution layer
+import orjson
+import asyncio
 
 # main agents
 from portable_brain.agent_service.execution_agent.agent import ExecutionAgent
@@ -11,75 +13,246 @@ from portable_brain.agent_service.common.types.orchestration_state import Retrie
 # logging
 from portable_brain.common.logging.logger import logger
 
+# max characters kept from each tool call's result_summary in the retrieval log
+MAX_RESULT_SUMMARY_CHARS = 200
+# params key marking a retrieval log entry as consecutive same-tool calls collapsed into one
+# NOTE: dunder-named so it can't collide with a real tool parameter
+COLLAPSED_CALLS_KEY = "__collapsed_calls__"
+
+# failure result used when the execution agent's response fails validation; copied with the raw text as result_summary
+_UNSTRUCTURED_TEMPLATE = ExecutionLLMOutput.model_construct(
+    success=False,
+    result_summary="",
+    failure_reason="Execution agent returned unstructured response",
+    missing_information=None,
+)
+
 class MainOrchestrator():
     """
     Main orchestration layer that loops between the retrieval agent and the execution agent.
     - The orchestrator is initialize request-scope, and holds necessary metadata during a single request loop.
     """
+    __slots__ = ("execution_agent", "retrieval_agent", "retrieval_state", "_serialized_queries", "_max_log_entries", "_tool_call_cache")
+
     def __init__(self, execution_agent: ExecutionAgent, retrieval_agent: RetrievalAgent):
         self.execution_agent: ExecutionAgent = execution_agent
         self.retrieval_agent: RetrievalAgent = retrieval_agent
         # define any state variables/metadata
         self.retrieval_state: RetrievalState
+        # JSON of each retrieval log entry, serialized once when the entry is recorded
+        self._serialized_queries: list[str] = []
+        self._max_log_entries: int = 10
+        # memory retriever tool results shared across all retrieval passes of a run, so re-retrieval never repeats an identical tool call
+        self._tool_call_cache: dict = {}
 
     async def run(
         self,
         user_request: str,
         max_iterations: int = 3,
         execution_agent_max_turns: int = 5,
-        retrieval_agent_max_turns: int = 5
+        retrieval_agent_max_turns: int = 5,
+        max_log_entries: int = 10,
+        iteration_timeout_s: float | None = None
     ) -> ExecutionLLMOutput:
         """
         Main orchestration loop: retrieve context -> execute -> re-retrieve on failure.
         Returns the final ExecutionLLMOutput (success or last failed attempt).
         - Maintains a cumulative retrieval log and state for re-retrieval.
+        - The retrieval log is compacted as it grows, and capped at max_log_entries to bound the re-retrieval prompt size.
+        - Halts early when execution fails twice in a row with the same failure reason and missing information.
+        - If iteration_timeout_s is set, each retrieval/execution step is bounded by it; on timeout, returns a failed result
+          (the agent call being awaited is cancelled by the timeout).
         """
         # track cumulative retrieval log across iterations
         all_previous_queries: list[RetrievalLogEntry] = []
+        self._serialized_queries = []
+        self._tool_call_cache = {}
+        self._max_log_entries = max_log_entries
 
         # 1) initial retrieval
-        retrieval_raw = await self.retrieval_agent.test_retrieve(user_request) # TODO: update helper method after retrieval agent implementation
+        try:
+            async with asyncio.timeout(iteration_timeout_s) as step_timeout:
+                retrieval_raw = await self._retrieve(user_request) # TODO: update helper method after retrieval agent implementation
+        except TimeoutError:
+            if not step_timeout.expired():
+                raise
+            return self._timed_out(iteration_timeout_s, "initial retrieval")
         retrieval_result = self._parse_retrieval(retrieval_raw)
         if retrieval_result is not None:
-            all_previous_queries.extend(retrieval_result.retrieval_log)
+            self._record_queries(all_previous_queries, retrieval_result.retrieval_log)
             context = retrieval_result.context_summary
         else:
             context = str(retrieval_raw)
 
+        # user_request never changes across iterations, so the re-retrieval prompt prefix is built once
+        re_retrieval_prefix = f"{user_request}\n\nretrieval_state:\n"
+
+        # fingerprint of the previous failure, used to halt early on repeated identical failures
+        prev_failure_fingerprint: tuple[str | None, str | None] | None = None
+
         for iteration in range(max_iterations):
-            # 2) execute with retrieved context
-            execution_raw = await self.execution_agent.execute_command(
-                user_request=user_request,
-                context=context,
-                max_turns=execution_agent_max_turns
-            )
-            execution_result = self._parse_execution(execution_raw)
-
-            # 3) check success
-            if execution_result.success:
-                return execution_result
-
-            # 4) build retrieval state for re-retrieval
-            self.retrieval_state = RetrievalState(
-                iteration=iteration + 1,
-                previous_queries=all_previous_queries,
-                execution_failure_reason=execution_result.failure_reason or "Unknown failure",
-                missing_information=execution_result.missing_information or "Unknown",
-            )
+            try:
+                async with asyncio.timeout(iteration_timeout_s) as step_timeout:
+                    # 2) execute with retrieved context
+                    execution_raw = await self.execution_agent.execute_command(
+                        user_request=user_request,
+                        context=context,
+                        max_turns=execution_agent_max_turns
+                    )
+                    execution_result = self._parse_execution(execution_raw)
+
+                    # 3) check success
+                    if execution_result.success:
+                        return execution_result
+
+                    # halt if the failure is identical to the previous attempt; re-retrieval already failed to fill the gap
+                    failure_fingerprint = (execution_result.failure_reason, execution_result.missing_information)
+                    if failure_fingerprint == prev_failure_fingerprint:
+                        logger.warning(f"Execution failed with the same reason as the previous attempt, halting re-retrieval at iteration {iteration + 1}")
+                        return execution_result
+                    prev_failure_fingerprint = failure_fingerprint
+
+                    # no iteration left to consume a re-retrieval, so don't start one
+                    if iteration == max_iterations - 1:
+                        break
 
-            # 5) re-retrieve with state appended to user prompt
-            re_retrieval_prompt = user_request + "\n\nretrieval_state:\n" + self.retrieval_state.model_dump_json()
-            retrieval_raw = await self.retrieval_agent.test_retrieve(re_retrieval_prompt, max_turns=retrieval_agent_max_turns)
-            retrieval_result = self._parse_retrieval(retrieval_raw)
-            if retrieval_result is not None:
-                all_previous_queries.extend(retrieval_result.retrieval_log)
-                context = retrieval_result.context_summary
-            else:
-                context = str(retrieval_raw)
+                    # 4) build retrieval state for re-retrieval
+                    # NOTE: built from already-validated internal data, so skip pydantic validation
+                    self.retrieval_state = RetrievalState.model_construct(
+                        iteration=iteration + 1,
+                        previous_queries=all_previous_queries,
+                        execution_failure_reason=execution_result.failure_reason or "Unknown failure",
+                        missing_information=execution_result.missing_information or "Unknown",
+                    )
+
+                    # 5) re-retrieve with state appended to user prompt
+                    re_retrieval_prompt = re_retrieval_prefix + self._dump_retrieval_state()
+                    retrieval_raw = await self._retrieve(re_retrieval_prompt, max_turns=retrieval_agent_max_turns)
+                    retrieval_result = self._parse_retrieval(retrieval_raw)
+                    if retrieval_result is not None:
+                        self._record_queries(all_previous_queries, retrieval_result.retrieval_log)
+                        context = retrieval_result.context_summary
+                    else:
+                        context = str(retrieval_raw)
+            except TimeoutError:
+                if not step_timeout.expired():
+                    raise
+                return self._timed_out(iteration_timeout_s, f"iteration {iteration + 1}")
 
         # exhausted all iterations, return last execution result
         return execution_result
 
+    async def _retrieve(self, retrieval_prompt: str, max_turns: int = 5):
+        """
+        Run a retrieval pass.
+        - Shares the run's tool call cache, so an identical memory retriever call made by an earlier pass isn't repeated.
+        """
+        return await self.retrieval_agent.test_retrieve(retrieval_prompt, max_turns=max_turns, call_cache=self._tool_call_cache)
+
+    def _timed_out(self, timeout_s: float | None, step: str) -> ExecutionLLMOutput:
+        """Build the failed result returned when a step exceeds the per-iteration timeout."""
+        logger.warning(f"Orchestration timed out after {timeout_s}s during {step}")
+        return ExecutionLLMOutput(
+            success=False,
+            result_summary=f"Timed out during {step}",
+            failure_reason=f"Orchestration step exceeded the {timeout_s}s iteration timeout",
+            missing_information=None,
+        )
+
+    def _record_queries(self, all_previous_queries: list[RetrievalLogEntry], entries: list[RetrievalLogEntry]) -> None:
+        """
+        Append new retrieval log entries, compacting the log as it grows and serializing each entry exactly once.
+        Compacted entries are built with model_construct(), since their fields come from already-validated LLM output.
+        Compaction (applied per entry, keeps the log and its serialized twin in sync):
+            1. truncates result_summary to MAX_RESULT_SUMMARY_CHARS
+            2. drops an earlier call with the same (tool, params), keeping only the latest; this includes calls already collapsed into an entry
+            3. collapses consecutive calls to the same tool into one entry with all params under COLLAPSED_CALLS_KEY,
+               joining their summaries (truncated again, so a run of same-tool calls stays within MAX_RESULT_SUMMARY_CHARS)
+            4. keeps only the most recent max_log_entries entries
+        """
+        for entry in entries:
+            entry = RetrievalLogEntry.model_construct(
+                tool=entry.tool,
+                params=entry.params,
+                result_summary=self._truncate_summary(entry.result_summary),
+            )
+
+            # dedup identical calls, keeping only the last
+            for idx, prev in enumerate(all_previous_queries):
+                if prev.tool != entry.tool:
+                    continue
+                if prev.params == entry.params:
+                    del all_previous_queries[idx]
+                    del self._serialized_queries[idx]
+                    break
+                prev_calls = prev.params.get(COLLAPSED_CALLS_KEY)
+                if prev_calls is not None and entry.params in prev_calls:
+                    # drop just the repeated call from the collapsed entry; its joined summary can't be split, so it's kept as-is
+                    remaining = [call for call in prev_calls if call != entry.params]
+                    if not remaining:
+                        del all_previous_queries[idx]
+                        del self._serialized_queries[idx]
+                    else:
+                        prev = RetrievalLogEntry.model_construct(
+                            tool=prev.tool,
+                            params={COLLAPSED_CALLS_KEY: remaining} if len(remaining) > 1 else remaining[0],
+                            result_summary=prev.result_summary,
+                        )
+                        all_previous_queries[idx] = prev
+                        self._serialized_queries[idx] = self._serialize_entry(prev)
+                    break
+
+            # collapse consecutive calls to the same tool
+            if all_previous_queries and all_previous_queries[-1].tool == entry.tool:
+                last = all_previous_queries.pop()
+                self._serialized_queries.pop()
+                last_calls = last.params.get(COLLAPSED_CALLS_KEY) or [last.params]
+                entry = RetrievalLogEntry.model_construct(
+                    tool=entry.tool,
+                    params={COLLAPSED_CALLS_KEY: [*last_calls, entry.params]},
+                    result_summary=self._truncate_summary(f"{last.result_summary} | {entry.result_summary}"),
+                )
+
+            all_previous_queries.append(entry)
+            self._serialized_queries.append(self._serialize_entry(entry))
+
+        # gate the log size, dropping the oldest entries first
+        overflow = len(all_previous_queries) - self._max_log_entries
+        if overflow > 0:
+            del all_previous_queries[:overflow]
+            del self._serialized_queries[:overflow]
+
+    @staticmethod
+    def _serialize_entry(entry: RetrievalLogEntry) -> str:
+        """Serialize a retrieval log entry to JSON, in RetrievalLogEntry field order."""
+        return orjson.dumps({
+            "tool": entry.tool,
+            "params": entry.params,
+            "result_summary": entry.result_summary,
+        }).decode()
+
+    @staticmethod
+    def _truncate_summary(summary: str) -> str:
+        """Truncate a tool call's result summary to MAX_RESULT_SUMMARY_CHARS."""
+        if len(summary) <= MAX_RESULT_SUMMARY_CHARS:
+            return summary
+        return summary[:MAX_RESULT_SUMMARY_CHARS] + "..."
+
+    def _dump_retrieval_state(self) -> str:
+        """
+        Serialize the current retrieval state to JSON.
+        - Reuses the per-entry JSON from _record_queries, so previous queries are not re-serialized every iteration.
+        - Output matches RetrievalState.model_dump_json() field order.
+        - Encoded with orjson rather than pydantic's serializer; the state is plain str/dict data, so no custom encoders are needed.
+        """
+        state = self.retrieval_state
+        return '{"iteration":%d,"previous_queries":[%s],"execution_failure_reason":%s,"missing_information":%s}' % (
+            state.iteration,
+            ",".join(self._serialized_queries),
+            orjson.dumps(state.execution_failure_reason).decode(),
+            orjson.dumps(state.missing_information).decode(),
+        )
+
     def _parse_retrieval(self, raw) -> MemoryRetrievalLLMOutput | None:
         """Parse retrieval output, returning None if validation failed and raw text was returned."""
         if isinstance(raw, MemoryRetrievalLLMOutput):
@@ -92,9 +265,4 @@ class MainOrchestrator():
         if isinstance(raw, ExecutionLLMOutput):
             return raw
         logger.warning(f"Execution agent returned raw text (validation failed): {str(raw)}")
-        return ExecutionLLMOutput(
-            success=False,
-            result_summary=str(raw),
-            failure_reason="Execution agent returned unstructured response",
-            missing_information=None,
-        )
+        return _UNSTRUCTURED_TEMPLATE.model_copy(update={"result_summary": str(raw)})
@@ -1,4 +1,9 @@
 # main retrieval agent and helpers
+import asyncio
+import json
+from contextvars import ContextVar
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Awaitable, Callable
 
 # import clients
 from portable_brain.common.services.llm_service.llm_client.google_genai_client import AsyncGenAITypedClient
@@ -15,6 +20,10 @@ from portable_brain.agent_service.common.types.llm_outputs.memory_retrieval_outp
 # logging
 from portable_brain.common.logging.logger import logger
 
+# results of tool calls already made, keyed by (tool name, canonical params JSON)
+# NOTE: a ContextVar since the agent is shared across requests; each retrieval call (or orchestrator run) binds its own dict
+_tool_call_cache: ContextVar[dict[tuple[str, str], Any] | None] = ContextVar("retrieval_tool_call_cache", default=None)
+
 class RetrievalAgent():
     """
     Main retrieval agent that tool calls to MemoryRetriever interface to access relevant memory.
@@ -31,16 +40,21 @@ class RetrievalAgent():
 
     TODO: implement helpers
     """
+    __slots__ = ("memory_retriever", "llm_client", "_tool_executors", "_tool_executors_testing")
+
     def __init__(self, memory_retriever: MemoryRetriever, gemini_llm_client: AsyncGenAITypedClient):
         self.memory_retriever = memory_retriever
         self.llm_client = gemini_llm_client
+        # tool executor maps are built once and shared (read-only) across all retrieval calls
+        self._tool_executors = MappingProxyType(self._build_tool_executors())
+        self._tool_executors_testing = MappingProxyType(self._build_tool_executors_for_testing())
 
     def _build_tool_executors(self) -> dict:
         """
         Light helper to map each declaration name to the corresponding MemoryRetriever method.
         Used to pass in a dict for tool executors to the LLM client.
         """
-        return {
+        tool_executors = self._memoize_executors({
             "get_people_relationships": self.memory_retriever.get_people_relationships,
             "get_long_term_preferences": self.memory_retriever.get_long_term_preferences,
             "get_short_term_preferences": self.memory_retriever.get_short_term_preferences,
@@ -54,7 +68,9 @@ class RetrievalAgent():
             "get_person_by_id": self.memory_retriever.get_person_by_id,
             "find_person_by_name": self.memory_retriever.find_person_by_name,
             "find_similar_person_relationships": self.memory_retriever.find_similar_person_relationships,
-        }
+        })
+        tool_executors["batch_memory_query"] = self._make_batch_executor(tool_executors)
+        return tool_executors
     
     def _build_tool_executors_for_testing(self) -> dict:
         """
@@ -62,7 +78,7 @@ class RetrievalAgent():
         Restricts the tool executors to a subset of MemoryRetriever methods.
         - NOTE: Only text log memory for now.
         """
-        return {
+        tool_executors = self._memoize_executors({
             # "get_people_relationships": self.memory_retriever.get_people_relationships,
             # "get_long_term_preferences": self.memory_retriever.get_long_term_preferences,
             # "get_short_term_preferences": self.memory_retriever.get_short_term_preferences,
@@ -75,20 +91,93 @@ class RetrievalAgent():
             # "get_person_by_id": self.memory_retriever.get_person_by_id,
             "find_person_by_name": self.memory_retriever.find_person_by_name,
             # "find_similar_person_relationships": self.memory_retriever.find_similar_person_relationships,
-        }
+        })
+        tool_executors["batch_memory_query"] = self._make_batch_executor(tool_executors)
+        return tool_executors
+
+    @staticmethod
+    def _memoize_executors(tool_executors: dict) -> dict:
+        """
+        Wraps each tool executor so an identical (tool, params) call is served from the bound _tool_call_cache.
+        - Only successful results are cached; failed calls are retried.
+        - Without a bound cache, executors run as-is.
+        """
+        def memoize(tool: str, executor: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+            async def memoized(**params) -> Any:
+                call_cache = _tool_call_cache.get()
+                if call_cache is None:
+                    return await executor(**params)
+                key = (tool, json.dumps(params, sort_keys=True, default=str))
+                if key in call_cache:
+                    logger.info(f"Tool call cache hit for {tool}, skipping memory retrieval")
+                    return call_cache[key]
+                result = await executor(**params)
+                call_cache[key] = result
+                return result
+            return memoized
+
+        return {tool: memoize(tool, executor) for tool, executor in tool_executors.items()}
+
+    @staticmethod
+    def _make_batch_executor(tool_executors: dict) -> Callable[..., Awaitable[list[dict]]]:
+        """
+        Builds the executor for the batch_memory_query tool over the given tool executors.
+        - Runs every query concurrently, so N independent lookups cost one LLM round trip instead of N.
+        - Each query fails independently; its error is returned in place of its result so the LLM can recover.
+        """
+        async def run_query(tool: str, params: dict) -> Any:
+            if tool == "batch_memory_query" or tool not in tool_executors:
+                raise ValueError(f"Unknown tool '{tool}' in batch_memory_query")
+            return await tool_executors[tool](**params)
 
-    async def test_retrieve(self, user_request: str, max_turns: int = 5):
+        async def batch_memory_query(queries: list[dict]) -> list[dict]:
+            queries = [{"tool": q.get("tool", ""), "params": dict(q.get("params") or {})} for q in queries]
+            results = await asyncio.gather(
+                *(run_query(q["tool"], q["params"]) for q in queries),
+                return_exceptions=True,
+            )
+            responses = []
+            for query, result in zip(queries, results):
+                if isinstance(result, Exception):
+                    responses.append({**query, "error": str(result)})
+                else:
+                    responses.append({**query, "result": result})
+            return responses
+
+        return batch_memory_query
+
+    async def test_retrieve(self, user_request: str, max_turns: int = 5, call_cache: dict | None = None):
         """
         Test helper to run a single retrieval pass against memory.
         Returns the LLM's final text response (expected to be MemoryRetrievalLLMOutput JSON).
+        - Identical tool calls are only executed once per call_cache; pass the same dict across re-retrievals to dedup between them.
         """
-        retrieved_result = await self.llm_client.atool_call(
+        token = _tool_call_cache.set(call_cache if call_cache is not None else {})
+        try:
+            retrieved_result = await self.llm_client.atool_call(
+                system_prompt=MemoryRetrievalPrompts.memory_retrieval_system_prompt_for_testing,
+                user_prompt=user_request,
+                function_declarations=memory_retriever_declarations_for_testing,
+                tool_executors=self._tool_executors_testing,
+                response_model=MemoryRetrievalLLMOutput,
+                max_turns=max_turns,
+            )
+        finally:
+            _tool_call_cache.reset(token)
+        logger.info(f"Retrieved result: {retrieved_result}")
+        return retrieved_result
+
+    async def test_retrieve_stream(self, user_request: str, max_turns: int = 5) -> AsyncIterator[str]:
+        """
+        Streaming variant of test_retrieve().
+        Yields the LLM's final text response in chunks as it is decoded; the joined chunks are the MemoryRetrievalLLMOutput JSON.
+        NOTE: chunks are unvalidated, so consumers that need the structured output should keep using test_retrieve().
+        """
+        async for chunk in self.llm_client.atool_call_stream(
             system_prompt=MemoryRetrievalPrompts.memory_retrieval_system_prompt_for_testing,
             user_prompt=user_request,
             function_declarations=memory_retriever_declarations_for_testing,
-            tool_executors=self._build_tool_executors_for_testing(),
-            response_model=MemoryRetrievalLLMOutput,
+            tool_executors=self._tool_executors_testing,
             max_turns=max_turns,
-        )
-        logger.info(f"Retrieved result: {retrieved_result}")
-        return retrieved_result
+        ):
+            yield chunk
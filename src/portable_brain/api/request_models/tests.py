@@ -1,13 +1,16 @@
 # test request body
 
-from pydantic import BaseModel
-from typing import Optional
-from enum import Enum
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+from typing import Optional, Literal
+
+# NOTE: request bodies are read-only inputs; frozen instances can be shared/hashed, and unknown fields are rejected up front
+REQUEST_MODEL_CONFIG = ConfigDict(frozen=True, extra="forbid")
 
 class TestRequest(BaseModel):
     """
     An example request body model to test Pydantic.
     """
+    model_config = REQUEST_MODEL_CONFIG
     request_msg: str
     requested_num: Optional[int] = None # this field can be omitted
 
@@ -15,6 +18,7 @@ class TestEmbeddingRequest(BaseModel):
     """
     Request body for testing embedding model.
     """
+    model_config = REQUEST_MODEL_CONFIG
     embedding_text: str
     observation_id: str
 
@@ -22,37 +26,44 @@ class SimilarEmbeddingRequest(BaseModel):
     """
     Request body for finding the most similar embedding in the DB.
     """
+    model_config = REQUEST_MODEL_CONFIG
     target_text: str
 
 class SaveObservationRequest(BaseModel):
     """
     Request body for saving a mocked observation to structured memory.
     """
+    model_config = REQUEST_MODEL_CONFIG
     observation_node: str
 
-class ScenarioName(str, Enum):
-    INSTAGRAM_CLOSE_FRIEND_MESSAGING = "instagram_close_friend_messaging"
-    MORNING_WORK_APP_ROUTINE = "morning_work_app_routine"
-    CROSS_PLATFORM_CONTACT_COMMUNICATION = "cross_platform_contact_communication"
-    INSTAGRAM_FITNESS_CONTENT_BROWSING = "instagram_fitness_content_browsing"
-    ONE_OFF_FOOD_DELIVERY = "one_off_food_delivery"
+# NOTE: a Literal rather than a str Enum, validated as a plain string set check; values are the SNAPSHOT_SCENARIOS keys
+ScenarioName = Literal[
+    "instagram_close_friend_messaging",
+    "morning_work_app_routine",
+    "cross_platform_contact_communication",
+    "instagram_fitness_content_browsing",
+    "one_off_food_delivery",
+]
 
 class ReplayScenarioRequest(BaseModel):
     """
     Request body for replaying a predefined state snapshot scenario through the observation tracker.
     """
+    model_config = REQUEST_MODEL_CONFIG
     scenario_name: ScenarioName
 
 class ToolCallRequest(BaseModel):
     """
     Request body for a natural language query to be executed on the device via tool calling.
     """
+    model_config = REQUEST_MODEL_CONFIG
     user_request: str
 
 class PersonRelationshipRequest(BaseModel):
     """
     Request body for saving an interpersonal relationship embedding.
     """
+    model_config = REQUEST_MODEL_CONFIG
     first_name: str
     last_name: Optional[str] = None
     id: Optional[str] = None  # defaults to a random UUID if not provided
@@ -61,11 +72,40 @@ class PersonRelationshipRequest(BaseModel):
     platform_handle: Optional[str] = None
 
 class SemanticSearchRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
     query: str
     limit: int = 5
     disable_cache: bool = False
 
 class FindPersonByNameRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
     name: str
     similarity_threshold: float = 0.3
     limit: int = 10
+
+# decode helpers for validating raw JSON request bodies outside of FastAPI's body parsing
+# NOTE: adapters are built once at import and validate bytes directly in pydantic-core, without a json.loads() dict in between
+_TEST_REQ_ADAPTER = TypeAdapter(TestRequest)
+_TEST_EMBEDDING_REQ_ADAPTER = TypeAdapter(TestEmbeddingRequest)
+_SIMILAR_EMBEDDING_REQ_ADAPTER = TypeAdapter(SimilarEmbeddingRequest)
+_SAVE_OBSERVATION_REQ_ADAPTER = TypeAdapter(SaveObservationRequest)
+_REPLAY_SCENARIO_REQ_ADAPTER = TypeAdapter(ReplayScenarioRequest)
+_TOOL_CALL_REQ_ADAPTER = TypeAdapter(ToolCallRequest)
+
+def decode_test_request(data: bytes) -> TestRequest:
+    return _TEST_REQ_ADAPTER.validate_json(data)
+
+def decode_test_embedding_request(data: bytes) -> TestEmbeddingRequest:
+    return _TEST_EMBEDDING_REQ_ADAPTER.validate_json(data)
+
+def decode_similar_embedding_request(data: bytes) -> SimilarEmbeddingRequest:
+    return _SIMILAR_EMBEDDING_REQ_ADAPTER.validate_json(data)
+
+def decode_save_observation_request(data: bytes) -> SaveObservationRequest:
+    return _SAVE_OBSERVATION_REQ_ADAPTER.validate_json(data)
+
+def decode_replay_scenario_request(data: bytes) -> ReplayScenarioRequest:
+    return _REPLAY_SCENARIO_REQ_ADAPTER.validate_json(data)
+
+def decode_tool_call_request(data: bytes) -> ToolCallRequest:
+    return _TOOL_CALL_REQ_ADAPTER.validate_json(data)
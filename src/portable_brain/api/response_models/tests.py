@@ -1,7 +1,8 @@
 # test response models
 
-from pydantic import BaseModel
-from typing import Optional
+from datetime import datetime
+from pydantic import BaseModel, ConfigDict
+from typing import Optional, TypedDict
 
 class TestResponse(BaseModel):
     """
@@ -10,11 +11,34 @@ class TestResponse(BaseModel):
     message: str
     list_msg: list[str]
 
-class SimilarEmbeddingResponse(BaseModel):
+class SimilarEmbeddingResponse(TypedDict):
     """
-    Response model for the closest embedding similarity search.
+    Response payload for the closest embedding similarity search.
+    NOTE: a TypedDict rather than a model, so the embedding float lists are serialized as-is instead of validated per element.
     """
     closest_text: str
     cosine_similarity_distance: float
     target_embedding: list[float]
     closest_embedding: list[float]
+
+class ObservationOut(BaseModel):
+    """
+    A single generated observation in a scenario replay.
+    NOTE: from_attributes lets the route hand observation objects over as-is; pydantic-core reads the fields directly.
+    """
+    model_config = ConfigDict(from_attributes=True)
+
+    id: str
+    node: str
+    memory_type: str
+    importance: float
+    created_at: Optional[datetime] = None
+
+class ReplayScenarioResponse(BaseModel):
+    """
+    Response payload for replaying a state snapshot scenario through the observation tracker.
+    """
+    scenario_name: str
+    snapshots_replayed: int
+    observations_generated: int
+    observations: list[ObservationOut]
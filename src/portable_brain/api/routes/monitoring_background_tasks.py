@@ -1,8 +1,8 @@
 # background async tasks for monitoring
-import time
-import asyncio
-from typing import Optional
-from fastapi import APIRouter, Depends, Query
+from typing import Optional, Callable, AsyncIterator
+from pydantic import TypeAdapter
+from fastapi import APIRouter, Depends, Query, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from portable_brain.common.services.droidrun_tools.droidrun_client import DroidRunClient
 from portable_brain.monitoring.background_tasks.observation_tracker import ObservationTracker
 from portable_brain.common.logging.logger import logger
@@ -10,9 +10,50 @@ from portable_brain.core.dependencies import get_droidrun_client, get_observatio
 
 # monitoring DTOs
 from portable_brain.monitoring.background_tasks.types.ui_states.state_changes import UIStateChange
-from portable_brain.monitoring.background_tasks.types.action.actions import Action
+from portable_brain.monitoring.background_tasks.types.ui_states.state_snapshot import UIStateSnapshot
+from portable_brain.monitoring.background_tasks.types.observation.observations import Observation
 
-router = APIRouter(prefix="/monitoring/background-tasks", tags=["Monitoring Background Tasks"])
+router = APIRouter(prefix="/monitoring/background-tasks", tags=["Monitoring Background Tasks"], default_response_class=ORJSONResponse)
+
+# NOTE: the tracker's history getters/clearers only touch in-memory deques, so handlers are async def and run on the event loop
+# plain def would send every poll through the threadpool for no benefit
+
+# per-item encoders, built once; history items are dumped to JSON one at a time so responses can stream
+_OBSERVATION_ADAPTER = TypeAdapter(Observation)
+_STATE_CHANGE_ADAPTER = TypeAdapter(UIStateChange)
+_SNAPSHOT_ADAPTER = TypeAdapter(UIStateSnapshot)
+
+# serialized history responses keyed by (endpoint, limit), each stored with the tracker version it was built from
+# NOTE: polling clients mostly re-read unchanged history, so the JSON is only rebuilt after the tracker's version moves
+_response_cache: dict[tuple[str, Optional[int]], tuple[int, bytes]] = {}
+
+async def _stream_and_cache(endpoint: str, limit: Optional[int], version: int, items: list, adapter: TypeAdapter) -> AsyncIterator[bytes]:
+    """
+    Yield {"<endpoint>": [...]} one encoded item at a time, then cache the full body once the stream completes.
+    - Peak serialization memory is one item (plus the chunks kept for the cache), and bytes go out as they are produced.
+    - A partially sent stream (client disconnect) is never cached.
+    """
+    chunks = [b'{"%s":[' % endpoint.encode()]
+    yield chunks[0]
+    for i, item in enumerate(items):
+        chunk = adapter.dump_json(item) if i == 0 else b"," + adapter.dump_json(item)
+        chunks.append(chunk)
+        yield chunk
+    chunks.append(b"]}")
+    yield chunks[-1]
+    _response_cache[(endpoint, limit)] = (version, b"".join(chunks))
+
+def _cached_json_response(endpoint: str, limit: Optional[int], version: int, build: Callable[[], list], adapter: TypeAdapter) -> Response:
+    """
+    Return the cached JSON body for (endpoint, limit) if still current, otherwise stream a fresh one and cache it.
+    - The body is {"<endpoint>": [...]}, with each list item encoded by the given per-item adapter.
+    - build() runs eagerly so tracker errors still surface as a 500 before any bytes are sent.
+    """
+    cached = _response_cache.get((endpoint, limit))
+    if cached is not None and cached[0] == version:
+        return Response(content=cached[1], media_type="application/json")
+    items = build()
+    return StreamingResponse(_stream_and_cache(endpoint, limit, version, items, adapter), media_type="application/json")
 
 @router.post("/start")
 async def start_observation_tracking(
@@ -22,11 +63,11 @@ async def start_observation_tracking(
 ):
     try:
         tracking_task = observation_tracker.start_background_tracking(poll_interval=poll_interval)
-        logger.info(f"Observation tracking task started: {tracking_task}")
+        logger.info("Observation tracking task started: %s", tracking_task)
         return {"message": "successfully started background observation tracking!"}
     except Exception as e:
-        logger.error(f"Error starting observation tracking task: {e}")
-        return {"message": f"Error starting observation tracking task: {e}"}, 500
+        logger.exception("Error starting observation tracking task")
+        return ORJSONResponse({"message": f"Error starting observation tracking task: {e}"}, status_code=500)
 
 @router.post("/stop")
 async def stop_observation_tracking(
@@ -37,12 +78,12 @@ async def stop_observation_tracking(
         await observation_tracker.stop_tracking()
         return {"message": "successfully stopped background observation tracking!"}
     except Exception as e:
-        logger.error(f"Error stopping observation tracking task: {e}")
-        return {"message": f"Error stopping observation tracking task: {e}"}, 500
+        logger.exception("Error stopping observation tracking task")
+        return ORJSONResponse({"message": f"Error stopping observation tracking task: {e}"}, status_code=500)
 
 # observation history
 @router.post("/clear-observations")
-def clear_observations(
+async def clear_observations(
     droidrun_client: DroidRunClient = Depends(get_droidrun_client),
     observation_tracker: ObservationTracker = Depends(get_observation_tracker),
 ):
@@ -50,27 +91,29 @@ def clear_observations(
         observation_tracker.clear_observations()
         return {"message": "successfully cleared observation history!"}
     except Exception as e:
-        logger.error(f"Error clearing observation history: {e}")
-        return {"message": f"Error clearing observation history: {e}"}, 500
+        logger.exception("Error clearing observation history")
+        return ORJSONResponse({"message": f"Error clearing observation history: {e}"}, status_code=500)
     
 @router.get("/get-observations")
-def retrieve_observations(
+async def retrieve_observations(
     limit: Optional[int] = Query(default=None, ge=1, le=100),
     droidrun_client: DroidRunClient = Depends(get_droidrun_client),
     observation_tracker: ObservationTracker = Depends(get_observation_tracker),
 ):
     try:
         # NOTE: only retrieve the most recent observations by limit
-        logger.info(f"Retrieving observation history with limit: {limit}")
-        observations = observation_tracker.get_observations(limit=limit)
-        return {"observations": observations}, 200
+        logger.info("Retrieving observation history with limit: %s", limit)
+        return _cached_json_response(
+            "observations", limit, observation_tracker.version,
+            lambda: observation_tracker.get_observations(limit=limit), _OBSERVATION_ADAPTER,
+        )
     except Exception as e:
-        logger.error(f"Error retrieving observation history: {e}")
-        return {"message": f"Error retrieving observation history: {e}"}, 500
+        logger.exception("Error retrieving observation history")
+        return ORJSONResponse({"message": f"Error retrieving observation history: {e}"}, status_code=500)
 
 # recent UI state change history
 @router.post("/clear-state-changes")
-def clear_state_changes(
+async def clear_state_changes(
     droidrun_client: DroidRunClient = Depends(get_droidrun_client),
     observation_tracker: ObservationTracker = Depends(get_observation_tracker),
 ):
@@ -78,27 +121,29 @@ def clear_state_changes(
         observation_tracker.clear_state_changes()
         return {"message": "successfully cleared recent UI state change history!"}
     except Exception as e:
-        logger.error(f"Error clearing UI state change history: {e}")
-        return {"message": f"Error clearing UI state change history: {e}"}, 500
+        logger.exception("Error clearing UI state change history")
+        return ORJSONResponse({"message": f"Error clearing UI state change history: {e}"}, status_code=500)
     
 @router.get("/get-recent-state-changes")
-def retrieve_recent_state_changes(
+async def retrieve_recent_state_changes(
     limit: Optional[int] = Query(default=None, ge=1, le=10),
     droidrun_client: DroidRunClient = Depends(get_droidrun_client),
     observation_tracker: ObservationTracker = Depends(get_observation_tracker),
 ):
     try:
         # NOTE: only retrieve the most recent state changes by limit
-        logger.info(f"Retrieving recent UI state change history with limit: {limit}")
-        state_changes = observation_tracker.get_state_changes(limit=limit)
-        return {"state_changes": state_changes}, 200
+        logger.info("Retrieving recent UI state change history with limit: %s", limit)
+        return _cached_json_response(
+            "state_changes", limit, observation_tracker.version,
+            lambda: observation_tracker.get_state_changes(limit=limit), _STATE_CHANGE_ADAPTER,
+        )
     except Exception as e:
-        logger.error(f"Error retrieving recent state change history: {e}")
-        return {"message": f"Error retrieving recent state change history: {e}"}, 500
+        logger.exception("Error retrieving recent state change history")
+        return ORJSONResponse({"message": f"Error retrieving recent state change history: {e}"}, status_code=500)
 
 # state snapshots history
 @router.post("/clear-state-snapshots")
-def clear_state_snapshots(
+async def clear_state_snapshots(
     droidrun_client: DroidRunClient = Depends(get_droidrun_client),
     observation_tracker: ObservationTracker = Depends(get_observation_tracker),
 ):
@@ -106,31 +151,33 @@ def clear_state_snapshots(
         observation_tracker.clear_state_snapshots()
         return {"message": "successfully cleared state snapshots history!"}
     except Exception as e:
-        logger.error(f"Error clearing state snapshots history: {e}")
-        return {"message": f"Error clearing state snapshots history: {e}"}, 500
+        logger.exception("Error clearing state snapshots history")
+        return ORJSONResponse({"message": f"Error clearing state snapshots history: {e}"}, status_code=500)
     
 @router.get("/get-state-snapshots")
-def retrieve_state_snapshots(
+async def retrieve_state_snapshots(
     limit: Optional[int] = Query(default=None, ge=1, le=10),
     observation_tracker: ObservationTracker = Depends(get_observation_tracker),
 ):
     try:
         # NOTE: only retrieve the most recent observations by limit
-        logger.info(f"Retrieving state snapshots with limit: {limit}")
-        snapshots = observation_tracker.get_state_snapshots(limit=limit)
-        return {"snapshots": snapshots}, 200
+        logger.info("Retrieving state snapshots with limit: %s", limit)
+        return _cached_json_response(
+            "snapshots", limit, observation_tracker.version,
+            lambda: observation_tracker.get_state_snapshots(limit=limit), _SNAPSHOT_ADAPTER,
+        )
     except Exception as e:
-        logger.error(f"Error retrieving state snapshots: {e}")
-        return {"message": f"Error retrieving state snapshots: {e}"}, 500
+        logger.exception("Error retrieving state snapshots")
+        return ORJSONResponse({"message": f"Error retrieving state snapshots: {e}"}, status_code=500)
 
 @router.get("/monitoring-overview")
-def retrieve_monitoring_overview(
+async def retrieve_monitoring_overview(
     droidrun_client: DroidRunClient = Depends(get_droidrun_client),
     observation_tracker: ObservationTracker = Depends(get_observation_tracker),
 ):
     try:
         overview = observation_tracker.get_monitoring_overview()
-        return {"overview": overview}, 200
+        return {"overview": overview}
     except Exception as e:
-        logger.error(f"Error retrieving monitoring overview: {e}")
-        return {"message": f"Error retrieving monitoring overview: {e}"}, 500
+        logger.exception("Error retrieving monitoring overview")
+        return ORJSONResponse({"message": f"Error retrieving monitoring overview: {e}"}, status_code=500)
@@ -1,34 +1,29 @@
 # test route for basic app functions like router + dependency injection
 
-import time
-from fastapi import APIRouter, Depends, Response, status, HTTPException, Query
+from fastapi import APIRouter, Depends, status, Query, HTTPException
+from fastapi.responses import ORJSONResponse
 from portable_brain.common.logging.logger import logger
-from portable_brain.common.db.session import get_async_session_maker
 # dependencies
 from portable_brain.core.dependencies import (
-    get_main_db_engine,
+    get_main_session_maker,
     get_droidrun_client,
-    get_gemini_llm_client,
-    get_nova_llm_client,
-    get_observation_tracker,
-    get_gemini_text_embedding_client
+    get_observation_tracker
 )
 # services and clients
 from portable_brain.common.services.droidrun_tools.droidrun_client import DroidRunClient
 from portable_brain.monitoring.background_tasks.observation_tracker import ObservationTracker
-from portable_brain.common.services.llm_service.llm_client import TypedLLMClient
-from portable_brain.common.services.embedding_service.text_embedding import TypedTextEmbeddingClient
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 # response models
-from portable_brain.api.response_models.tests import TestResponse, SimilarEmbeddingResponse
+from portable_brain.api.response_models.tests import TestResponse
 # request body models
-from portable_brain.api.request_models.tests import TestRequest, TestEmbeddingRequest, SimilarEmbeddingRequest
-# crud
-from portable_brain.common.db.crud.memory.text_embeddings_crud import find_similar_embeddings
+from portable_brain.api.request_models.tests import TestRequest
 
-router = APIRouter(prefix="/general-test", tags=["Tests"])
+router = APIRouter(prefix="/general-test", tags=["Tests"], default_response_class=ORJSONResponse)
+
+# dummy query, built once instead of per request
+PING = text("SELECT 1")
 
 @router.get("/first-test")
 async def first_test():
@@ -36,45 +31,43 @@ async def first_test():
     return {"message": "this is the first test route"}
 
 @router.get("/second-test")
-async def second_test(main_db_engine: AsyncEngine = Depends(get_main_db_engine)):
+async def second_test(main_session_maker: async_sessionmaker[AsyncSession] = Depends(get_main_session_maker)):
     logger.info("second test route, trying to inject db session")
-    main_session_maker = get_async_session_maker(main_db_engine)
 
     try:
         async with main_session_maker() as session:
-            await session.execute(text("SELECT 1"))
-    except Exception as e:
-        logger.info(f"error: {e}")
+            await session.execute(PING)
+    except Exception:
+        logger.exception("error injecting db session")
         return {"message": "unable to inject db session"}
 
-    logger.info(f"db session successfully injected, dummy query passed")
+    logger.info("db session successfully injected, dummy query passed")
     return {"message": "db session successfully injected, dummy query passed"}
 
-# test route for Pydantic-validated response schema and request body
-@router.post("/third-test", response_model=TestResponse)
+# test route for Pydantic-validated request body and response object
+# NOTE: the response is built here, so it's serialized directly with orjson instead of re-validated via response_model
+@router.post("/third-test")
 async def third_test(
-    request: TestRequest,
-    response: Response
+    request: TestRequest
 ):
     # logging to test request body parsing
-    logger.info(f"Third test route, request: {request}")
+    logger.info("Third test route, request: %s", request)
     if request.requested_num is None:
         logger.info("requested_num is None")
     elif request.requested_num > 0:
-        logger.info(f"requested_num is positive")
+        logger.info("requested_num is positive")
     elif request.requested_num < 0:
-        logger.info(f"requested_num is negative")
+        logger.info("requested_num is negative")
     else:
-        logger.info(f"requested_num is 0")
+        logger.info("requested_num is 0")
     
-    # NOTE: FastAPI allows returning the actual pydantic model obj.
-    response_obj = TestResponse(
+    # NOTE: built from already-validated request data, so skip pydantic validation
+    response_obj = TestResponse.model_construct(
         message=f"the requested msg is: {request.request_msg}",
         list_msg=["this", "is", "a", "list", "of", "strings"]
     )
-    # adjust the Response status directly
-    response.status_code = status.HTTP_200_OK
-    return response_obj
+    # flat model of primitives, so its __dict__ is directly serializable; set the status on the response directly
+    return ORJSONResponse(response_obj.__dict__, status_code=status.HTTP_200_OK)
 
 # test llm observation tracking
 @router.post("/fourth-test")
@@ -89,5 +82,5 @@ async def start_observation_tracking(
         await observation_tracker.create_test_observation()
         return {"message": "successfully tested llm observation!"}
     except Exception as e:
-        logger.error(f"Error starting observation tracking task: {e}")
-        return {"message": f"Error starting observation tracking task: {e}"}, 500
+        logger.exception("Error starting observation tracking task")
+        raise HTTPException(status_code=500, detail=f"Error starting observation tracking task: {e}")
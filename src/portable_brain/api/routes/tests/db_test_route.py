@@ -1,40 +1,26 @@
 # test route for db-related functionality
 # NOTE: currently supports all dbs, both vector db and structured db; may be split in the future.
 
-import time
 from uuid import uuid4
-from fastapi import APIRouter, Depends, Response, status, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 from portable_brain.common.logging.logger import logger
-from portable_brain.common.db.session import get_async_session_maker
 # dependencies
 from portable_brain.core.dependencies import (
-    get_main_db_engine,
-    get_droidrun_client,
-    get_gemini_llm_client,
-    get_nova_llm_client,
-    get_observation_tracker,
-    get_gemini_text_embedding_client
+    get_main_db_engine
 )
 # services and clients
-from portable_brain.common.services.droidrun_tools.droidrun_client import DroidRunClient
-from portable_brain.monitoring.background_tasks.observation_tracker import ObservationTracker
-from portable_brain.common.services.llm_service.llm_client import TypedLLMClient
-from portable_brain.common.services.embedding_service.text_embedding import TypedTextEmbeddingClient
-from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncEngine
 
-# response models
-from portable_brain.api.response_models.tests import TestResponse, SimilarEmbeddingResponse
 # request body models
-from portable_brain.api.request_models.tests import TestRequest, TestEmbeddingRequest, SimilarEmbeddingRequest, SaveObservationRequest
+from portable_brain.api.request_models.tests import SaveObservationRequest
 # crud
-from portable_brain.common.db.crud.memory.text_embeddings_crud import find_similar_embeddings
 from portable_brain.common.db.crud.memory.structured_memory_crud import save_observation_to_structured_memory
 # observation DTOs
 from portable_brain.monitoring.background_tasks.types.observation.observations import ShortTermPreferencesObservation
 from datetime import datetime
 
-router = APIRouter(prefix="/db-test", tags=["Tests"])
+router = APIRouter(prefix="/db-test", tags=["Tests"], default_response_class=ORJSONResponse)
 
 @router.post("/save-observation")
 async def save_observation(
@@ -58,5 +44,5 @@ async def save_observation(
         )
         return {"message": f"Successfully saved observation '{mock_observation.id}' to structured memory"}
     except Exception as e:
-        logger.error(f"Error saving observation to structured memory: {e}")
+        logger.error("Error saving observation to structured memory: %s", e)
         raise HTTPException(status_code=500, detail=f"Error saving observation to structured memory: {e}")
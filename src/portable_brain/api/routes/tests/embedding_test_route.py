@@ -1,34 +1,31 @@
 # test route for embedding-related functionality
 
-import time
-from fastapi import APIRouter, Depends, Response, status, HTTPException, Query
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 from portable_brain.common.logging.logger import logger
-from portable_brain.common.db.session import get_async_session_maker
 # dependencies
 from portable_brain.core.dependencies import (
     get_main_db_engine,
-    get_droidrun_client,
-    get_gemini_llm_client,
-    get_nova_llm_client,
+    get_main_session_maker,
     get_observation_tracker,
-    get_gemini_text_embedding_client
+    get_gemini_text_embedding_client,
+    get_embedding_batcher
 )
 # services and clients
-from portable_brain.common.services.droidrun_tools.droidrun_client import DroidRunClient
 from portable_brain.monitoring.background_tasks.observation_tracker import ObservationTracker
-from portable_brain.common.services.llm_service.llm_client import TypedLLMClient
 from portable_brain.common.services.embedding_service.text_embedding import TypedTextEmbeddingClient
-from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncEngine
+from portable_brain.common.services.embedding_service.text_embedding.batcher import EmbeddingMicroBatcher
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
 # response models
-from portable_brain.api.response_models.tests import TestResponse, SimilarEmbeddingResponse
+from portable_brain.api.response_models.tests import SimilarEmbeddingResponse
 # request body models
-from portable_brain.api.request_models.tests import TestRequest, TestEmbeddingRequest, SimilarEmbeddingRequest, PersonRelationshipRequest
+from portable_brain.api.request_models.tests import TestEmbeddingRequest, SimilarEmbeddingRequest, PersonRelationshipRequest
 # crud
 from portable_brain.common.db.crud.memory.text_embeddings_crud import find_similar_embeddings
 
-router = APIRouter(prefix="/embedding-test", tags=["Tests"])
+router = APIRouter(prefix="/embedding-test", tags=["Tests"], default_response_class=ORJSONResponse)
 
 @router.post("/test-text-embedding")
 async def test_text_embedding(
@@ -45,8 +42,8 @@ async def test_text_embedding(
         await observation_tracker.embedding_generator.generate_and_save_embedding(observation_id=observation_id, observation_text=request.embedding_text)
         return {"message": "successfully tested text embedding!"}
     except Exception as e:
-        logger.error(f"Error testing text embedding: {e}")
-        return {"message": f"Error testing text embedding: {e}"}, 500
+        logger.error("Error testing text embedding: %s", e)
+        raise HTTPException(status_code=500, detail=f"Error testing text embedding: {e}")
 
 @router.post("/save-person-relationship")
 async def save_person_relationship(
@@ -64,42 +61,55 @@ async def save_person_relationship(
         )
         return {"message": "successfully saved person relationship embedding!"}
     except Exception as e:
-        logger.error(f"Error saving person relationship: {e}")
+        logger.error("Error saving person relationship: %s", e)
         raise HTTPException(status_code=500, detail=f"Error saving person relationship: {e}")
 
-@router.post("/find-similar-embedding", response_model=SimilarEmbeddingResponse)
+@router.post("/find-similar-embedding", response_class=ORJSONResponse)
 async def find_similar_embedding(
     request: SimilarEmbeddingRequest,
-    embedding_client: TypedTextEmbeddingClient = Depends(get_gemini_text_embedding_client),
-    main_db_engine: AsyncEngine = Depends(get_main_db_engine)
+    embedding_batcher: EmbeddingMicroBatcher = Depends(get_embedding_batcher),
+    main_db_engine: AsyncEngine = Depends(get_main_db_engine),
+    main_session_maker: async_sessionmaker[AsyncSession] = Depends(get_main_session_maker)
 ):
     try:
-        # embed the target text
-        target_embeddings = await embedding_client.aembed_text([request.target_text])
-        target_vector = target_embeddings[0]
+        async with main_session_maker() as session:
+            # embed the target text (batched with any concurrent requests) while the session checks out and pings its connection
+            # NOTE: the similarity query itself needs the vector, so only the connection setup can overlap with the embedding call
+            # both are awaited to completion before any error propagates, so the session never closes mid-checkout
+            target_vector, connection = await asyncio.gather(
+                embedding_batcher.submit(request.target_text),
+                session.connection(),
+                return_exceptions=True,
+            )
+            for outcome in (target_vector, connection):
+                if isinstance(outcome, BaseException):
+                    raise outcome
 
-        # find closest match in db by cosine distance
-        results = await find_similar_embeddings(
-            query_vector=target_vector,
-            limit=1,
-            main_db_engine=main_db_engine,
-            distance_metric="cosine"
-        )
+            # find closest match in db by cosine distance
+            results = await find_similar_embeddings(
+                query_vector=target_vector,
+                limit=1,
+                main_db_engine=main_db_engine,
+                distance_metric="cosine",
+                session=session,
+                include_vector=True
+            )
 
         if not results:
             raise HTTPException(status_code=404, detail="No embeddings found in the database.")
 
         closest_record, distance = results[0]
 
-        logger.info(f"Found closest embedding for '{request.target_text}' with distance {distance:.4f}")
-        return SimilarEmbeddingResponse(
+        logger.info("Found closest embedding for '%s' with distance %.4f", request.target_text, distance)
+        # NOTE: stored vectors come back as list[float] (see BinaryHALFVEC), which orjson serializes as-is
+        return ORJSONResponse(SimilarEmbeddingResponse(
             closest_text=closest_record.observation_text,
             cosine_similarity_distance=distance,
             target_embedding=target_vector[:5],
             closest_embedding=closest_record.embedding_vector[:5],
-        )
+        ))
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error finding similar embedding: {e}")
+        logger.error("Error finding similar embedding: %s", e)
         raise HTTPException(status_code=500, detail=f"Error finding similar embedding: {e}")
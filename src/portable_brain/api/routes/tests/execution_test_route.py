@@ -1,12 +1,11 @@
 # test route to execute natural language queries on device via droidrun
 
 from fastapi import APIRouter, Depends
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse
 from portable_brain.common.logging.logger import logger
 
 # agents
 from portable_brain.agent_service.execution_agent.agent import ExecutionAgent
-from portable_brain.agent_service.retrieval_agent.agent import RetrievalAgent
 from portable_brain.agent_service.orchestrator.main_orchestrator import MainOrchestrator
 # droidrun
 from portable_brain.common.services.droidrun_tools.droidrun_client import DroidRunClient
@@ -14,7 +13,7 @@ from portable_brain.common.services.droidrun_tools.droidrun_client import DroidR
 # dependencies
 from portable_brain.core.dependencies import (
     get_execution_agent,
-    get_retrieval_agent,
+    get_main_orchestrator,
     get_droidrun_client
 )
 
@@ -26,7 +25,7 @@ from portable_brain.config.app_config import get_service_settings
 
 settings = get_service_settings()
 
-router = APIRouter(prefix="/execution-test", tags=["Agent Tests"])
+router = APIRouter(prefix="/execution-test", tags=["Agent Tests"], default_response_class=ORJSONResponse)
 
 @router.post("/tool-call")
 async def test_tool_call(
@@ -37,7 +36,7 @@ async def test_tool_call(
     Test route: Gemini tool-calls DroidRun's execute_command with a custom user request.
     """
     result = await tool_calling_agent.test_tool_call(request.user_request)
-    logger.info(f"Tool call test result: {result}")
+    logger.info("Tool call test result: %s", result)
     return {"result": result}
 
 # NOTE: below are three sets of execution tests for benchmarking
@@ -45,8 +44,7 @@ async def test_tool_call(
 @router.post("/orchestrated-execution-test")
 async def rag_execution_test(
     request: ToolCallRequest,
-    execution_agent: ExecutionAgent = Depends(get_execution_agent),
-    retrieval_agent: RetrievalAgent = Depends(get_retrieval_agent)
+    main_orchestrator: MainOrchestrator = Depends(get_main_orchestrator)
 ):
     """
     Tests the main orchestration logic and full retrieval-execution loop.
@@ -55,15 +53,15 @@ async def rag_execution_test(
     - yes semantic enrichment of user request
     - yes augmented context
     """
-    main_orchestrator = MainOrchestrator(execution_agent, retrieval_agent)
     result = await main_orchestrator.run(
         user_request=request.user_request,
         # max_iterations=settings.orchestrator_max_iterations,
         max_iterations=1,
         execution_agent_max_turns=settings.execution_agent_max_turns,
-        retrieval_agent_max_turns=settings.retrieval_agent_max_turns
+        retrieval_agent_max_turns=settings.retrieval_agent_max_turns,
+        iteration_timeout_s=settings.orchestrator_iteration_timeout_s
     )
-    logger.info(f"RAG execution test result: {result}")
+    logger.info("RAG execution test result: %s", result)
     return {"result": result}
 
 @router.post("/no-context-execution-test")
@@ -81,7 +79,7 @@ async def direct_execution_test(
         user_request=request.user_request,
         max_turns=settings.execution_agent_max_turns
     )
-    logger.info(f"No augmented context execution test result: {result}")
+    logger.info("No augmented context execution test result: %s", result)
     return {"result": result}
 
 @router.post("/direct-droidrun-execution-test")
@@ -96,5 +94,5 @@ async def direct_droidrun_execution_test(
     """
     
     result = await droidrun_client.execute_command(request.user_request)
-    logger.info(f"Direct DroidRun execution test result: {result.model_dump()}")
-    return {"result": result.model_dump()}
+    logger.info("Direct DroidRun execution test result: %s", result)
+    return {"result": result}
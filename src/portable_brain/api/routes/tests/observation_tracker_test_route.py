@@ -1,41 +1,68 @@
 # test route to fetch data from droidrun client or observation tracker
 
 import time
-from fastapi import APIRouter, Depends, Response, status, Query
+import orjson
+from functools import lru_cache
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable
+from fastapi import APIRouter, Depends, Query, HTTPException, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from portable_brain.common.logging.logger import logger
-from portable_brain.common.db.session import get_async_session_maker
 # dependencies
 from portable_brain.core.dependencies import (
-    get_main_db_engine,
     get_droidrun_client,
-    get_gemini_llm_client,
-    get_nova_llm_client,
-    get_observation_tracker,
-    get_gemini_text_embedding_client
+    get_observation_tracker
 )
 # services and clients
 from portable_brain.common.services.droidrun_tools.droidrun_client import DroidRunClient
 from portable_brain.monitoring.background_tasks.observation_tracker import ObservationTracker
-from portable_brain.common.services.llm_service.llm_client import TypedLLMClient
-from portable_brain.common.services.embedding_service.text_embedding import TypedTextEmbeddingClient
-from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncEngine
 
-# response models
-from portable_brain.api.response_models.tests import TestResponse, SimilarEmbeddingResponse
 # request body models
-from portable_brain.api.request_models.tests import TestRequest, TestEmbeddingRequest, SimilarEmbeddingRequest, ReplayScenarioRequest
+from portable_brain.api.request_models.tests import ReplayScenarioRequest
+# response models
+from portable_brain.api.response_models.tests import ReplayScenarioResponse
 # fixtures
 from portable_brain.monitoring.fixtures.state_snapshot_scenarios import SNAPSHOT_SCENARIOS
-# crud
-from portable_brain.common.db.crud.memory.text_embeddings_crud import find_similar_embeddings
+from portable_brain.monitoring.background_tasks.types.ui_states.state_snapshot import UIStateSnapshot
 
 # helper to compress raw tree
 from portable_brain.common.services.droidrun_tools.a11y_tree_parser import denoise_formatted_text
 
-router = APIRouter(prefix="/tracker-test", tags=["Tests"])
+router = APIRouter(prefix="/tracker-test", tags=["Tests"], default_response_class=ORJSONResponse)
+
+# most recent device reads keyed by fetch name, reused by rapid polling within a short TTL
+# NOTE: a plain TTL rather than a screen hash key; the screen can only be identified by reading it, which is the RPC being skipped
+_DEVICE_READ_TTL_S = 0.2
+_device_read_cache: dict[str, tuple[float, Any]] = {}
+
+async def _read_device(name: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+    """Return the cached result of a device read if it is younger than _DEVICE_READ_TTL_S, otherwise fetch and cache it."""
+    cached = _device_read_cache.get(name)
+    if cached is not None and time.monotonic() - cached[0] < _DEVICE_READ_TTL_S:
+        return cached[1]
+    result = await fetch()
+    _device_read_cache[name] = (time.monotonic(), result)
+    return result
 
-@router.post("/replay-scenario")
+@lru_cache(maxsize=None)
+def _build_scenario(scenario_name: str) -> tuple[UIStateSnapshot, ...]:
+    """
+    Build a snapshot scenario once and reuse it for later replays.
+    - Scenarios are deterministic fixtures (fixed timestamps), and replay only reads the snapshots, so sharing them is safe.
+    - Returned as a tuple so the cached sequence itself can't be mutated by a caller.
+    NOTE: unknown names never get here; ReplayScenarioRequest.scenario_name is a Literal, so they're rejected with a 422.
+    """
+    return tuple(SNAPSHOT_SCENARIOS[scenario_name]())
+
+async def _ndjson_records(records: Iterable[tuple[str, Any]]) -> AsyncIterator[bytes]:
+    """
+    Yield each (key, value) pair as its own {"key": value} NDJSON line.
+    - Only one field is encoded at a time, so small fields reach the client before large ones (ui_elements, raw trees) finish.
+    """
+    for key, value in records:
+        yield orjson.dumps({key: value}, default=str) + b"\n"
+
+@router.post("/replay-scenario", response_model=ReplayScenarioResponse)
 async def replay_scenario(
     request: ReplayScenarioRequest,
     observation_tracker: ObservationTracker = Depends(get_observation_tracker),
@@ -44,83 +71,86 @@ async def replay_scenario(
     Replays a predefined state snapshot scenario through the observation tracker.
     Useful for testing the full memory pipeline without a real device.
     """
-    snapshots = SNAPSHOT_SCENARIOS[request.scenario_name]()
-    logger.info(f"Replaying scenario '{request.scenario_name}' with {len(snapshots)} snapshots")
+    snapshots = _build_scenario(request.scenario_name)
+    logger.info("Replaying scenario '%s' with %d snapshots", request.scenario_name, len(snapshots))
 
-    await observation_tracker.replay_state_snapshots(snapshots)
+    await observation_tracker.replay_state_snapshots(list(snapshots))
 
     observations = observation_tracker.observations
-    return {
+    response = ReplayScenarioResponse.model_validate({
         "scenario_name": request.scenario_name,
         "snapshots_replayed": len(snapshots),
         "observations_generated": len(observations),
-        "observations": [
-            {
-                "id": obs.id,
-                "node": obs.node,
-                "memory_type": obs.memory_type.value,
-                "importance": obs.importance,
-                "created_at": obs.created_at.isoformat() if obs.created_at else None,
-            }
-            for obs in observations
-        ],
-    }
+        # NOTE: converted by the ObservationOut model (from_attributes), not field by field here
+        "observations": observations,
+    })
+    # NOTE: pydantic-core encodes straight to bytes; returning a Response skips FastAPI's second validate + serialize pass over response_model
+    return Response(content=response.model_dump_json(), media_type="application/json")
 
 @router.get("/get-raw-tree")
 async def get_raw_accessibility_tree(
+    stream: bool = Query(default=False, description="Stream each top-level field as a separate NDJSON record"),
+    include_raw: bool = Query(default=False, description="Also fetch and return the complete unfiltered a11y tree"),
     droidrun_client: DroidRunClient = Depends(get_droidrun_client)
 ):
     """
     Get the raw accessibility tree from the current screen.
     Returns all available information from the a11y tree including:
-    - raw_tree: Complete unfiltered accessibility tree
+    - raw_tree: Complete unfiltered accessibility tree (only when include_raw=true)
     - formatted_text: Human-readable indexed UI description
     - focused_element: Currently focused element
     - ui_elements: Parsed list of UI elements
     - phone_state: Current app package, activity, and editable status
+    With stream=true, the same fields are sent as application/x-ndjson, one {"field": value} record per line.
     """
     try:
         logger.info("Fetching raw accessibility tree from current screen")
-        state = await droidrun_client.get_current_state()
-        raw_tree = await droidrun_client.get_raw_tree()
+        # NOTE: get_current_state already carries the raw tree cached by the same get_state() call, so no separate get_raw_tree RPC
+        state = await _read_device("current_state", droidrun_client.get_current_state)
 
-        return {
+        payload = {
             "message": "Successfully retrieved raw accessibility tree",
             # "raw_tree": state["raw_tree"],
-            "formatted_text": state["formatted_text"],
             "focused_element": state["focused_element"],
-            "ui_elements": state["ui_elements"],
             "phone_state": state["phone_state"],
-            "timestamp": state["timestamp"]
+            "timestamp": state["timestamp"],
+            "formatted_text": state["formatted_text"],
+            "ui_elements": state["ui_elements"],
+            # the raw tree is the bulk of the payload, so it's only included on request
+            **({"raw_tree": {"raw_tree": state["raw_tree"]}} if include_raw else {}),
         }
-        # return {
-        #     "message": "ok",
-        #     "raw_tree": raw_tree["raw_tree"]
-        # }
+        if stream:
+            return StreamingResponse(_ndjson_records(payload.items()), media_type="application/x-ndjson")
+        # NOTE: the tree payload is plain dicts/lists/strings, so hand it straight to orjson instead of through jsonable_encoder
+        return ORJSONResponse(content=payload)
     except Exception as e:
-        logger.error(f"Error fetching raw accessibility tree: {e}")
-        return {"message": f"Error fetching raw accessibility tree: {e}"}, 500
+        logger.error("Error fetching raw accessibility tree: %s", e)
+        raise HTTPException(status_code=500, detail=f"Error fetching raw accessibility tree: {e}")
 
 @router.get("/get-droidrun-state")
 async def get_droidrun_state(
+    stream: bool = Query(default=False, description="Stream the message and each raw state part as separate NDJSON records"),
     droidrun_client: DroidRunClient = Depends(get_droidrun_client)
 ):
     """
     Gets the raw UI state given by DroidRun SDK.
+    With stream=true, sends application/x-ndjson: a message record, then one {"raw_state": part} record per element of the state tuple.
     """
     try:
         logger.info("Fetching raw UI state from current screen")
-        state = await droidrun_client.get_raw_state()
-        raw_tree = await droidrun_client.get_raw_tree()
+        state = await _read_device("raw_state", droidrun_client.get_raw_state)
 
+        if stream:
+            records = [("message", "Successfully retrieved raw accessibility tree"), *(("raw_state", part) for part in state)]
+            return StreamingResponse(_ndjson_records(records), media_type="application/x-ndjson")
         return {
             "message": "Successfully retrieved raw accessibility tree",
             "raw_state": state
         }
     
     except Exception as e:
-        logger.error(f"Error fetching raw UI state: {e}")
-        return {"message": f"Error fetching raw UI state from DroidRun: {e}"}, 500
+        logger.error("Error fetching raw UI state: %s", e)
+        raise HTTPException(status_code=500, detail=f"Error fetching raw UI state from DroidRun: {e}")
 
 @router.get("/get-formatted-tree")
 async def get_formatted_tree(
@@ -132,19 +162,19 @@ async def get_formatted_tree(
     """
     try:
         logger.info("Fetching formatted accessibility tree from current screen")
-        raw_state = await droidrun_client.get_raw_state()
-        state = await droidrun_client.get_current_state()
+        # NOTE: raw state, current state and raw tree all come from the same tools.get_state() call, so one read covers all three
+        state = await _read_device("current_state", droidrun_client.get_current_state)
 
-        cleaned_text = denoise_formatted_text(raw_state[0])
-        raw_tree = await droidrun_client.get_raw_tree()
+        # NOTE: denoising a large tree is pure-Python line parsing (~15ms for 2k elements), so keep it off the event loop
+        cleaned_text = await run_in_threadpool(denoise_formatted_text, state["formatted_text"])
 
         return {
             "message": "Successfully retrieved formatted accessibility tree",
             "cleaned_text": cleaned_text,
             "formatted_text": state["formatted_text"],
-            "raw_tree": raw_tree
+            "raw_tree": {"raw_tree": state["raw_tree"]}
         }
 
     except Exception as e:
-        logger.error(f"Error fetching formatted accessibility tree: {e}")
-        return {"message": f"Error fetching formatted accessibility tree: {e}"}, 500
+        logger.error("Error fetching formatted accessibility tree: %s", e)
+        raise HTTPException(status_code=500, detail=f"Error fetching formatted accessibility tree: {e}")
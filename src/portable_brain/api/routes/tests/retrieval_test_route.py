@@ -3,18 +3,15 @@
 
 import time
 from fastapi import APIRouter, Depends
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from portable_brain.common.logging.logger import logger
 
 # agents
 from portable_brain.agent_service.retrieval_agent.agent import RetrievalAgent
-# droidrun
-from portable_brain.common.services.droidrun_tools.droidrun_client import DroidRunClient
 
 # dependencies
 from portable_brain.core.dependencies import (
     get_retrieval_agent,
-    get_droidrun_client,
     get_memory_retriever,
 )
 from portable_brain.memory.main_retriever import MemoryRetriever
@@ -27,7 +24,7 @@ from portable_brain.config.app_config import get_service_settings
 
 settings = get_service_settings()
 
-router = APIRouter(prefix="/retrieval-test", tags=["Agent Tests"])
+router = APIRouter(prefix="/retrieval-test", tags=["Agent Tests"], default_response_class=ORJSONResponse)
 
 @router.post("/retrieval-test")
 async def test_tool_call(
@@ -42,6 +39,20 @@ async def test_tool_call(
     # logger.info(f"Retrieval test result: {result}")
     return {"result": result}
 
+@router.post("/retrieval-stream-test")
+async def test_retrieval_stream(
+    request: ToolCallRequest,
+    retrieval_agent: RetrievalAgent = Depends(get_retrieval_agent)
+):
+    """
+    Test route: streams the RetrievalAgent's final response as it is decoded.
+    Memory tool calls are still resolved before the first chunk is sent.
+    """
+    return StreamingResponse(
+        retrieval_agent.test_retrieve_stream(request.user_request),
+        media_type="text/plain",
+    )
+
 @router.post("/find-person-by-name")
 async def test_find_person_by_name(
     request: FindPersonByNameRequest,
@@ -58,7 +69,7 @@ async def test_find_person_by_name(
         limit=request.limit,
     )
     elapsed_ms = (time.perf_counter() - start) * 1000
-    logger.info(f"find_person_by_name '{request.name}' took {elapsed_ms:.2f}ms, {len(results)} result(s)")
+    logger.info("find_person_by_name '%s' took %.2fms, %d result(s)", request.name, elapsed_ms, len(results))
     return {"results": results, "elapsed_ms": round(elapsed_ms, 2)}
 
 @router.post("/semantic-search")
@@ -77,5 +88,5 @@ async def test_semantic_search(
         disable_cache=request.disable_cache,
     )
     elapsed_ms = (time.perf_counter() - start) * 1000
-    logger.info(f"Semantic search took {elapsed_ms:.2f}ms (cache disabled: {request.disable_cache})")
+    logger.info("Semantic search took %.2fms (cache disabled: %s)", elapsed_ms, request.disable_cache)
     return {"results": results, "elapsed_ms": round(elapsed_ms, 2)}
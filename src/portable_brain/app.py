@@ -1,24 +1,24 @@
-from fastapi import FastAPI, Depends
+import asyncio
+from fastapi import FastAPI, Depends, Request, Response
+from fastapi.responses import ORJSONResponse
+from starlette.exceptions import HTTPException as StarletteHTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from typing import Any, Optional, Dict
+from typing import Any, Awaitable
 from portable_brain.common.logging.logger import logger
 from portable_brain.config.app_config import get_service_settings
 from portable_brain.core.lifespan import lifespan
-from portable_brain.common.db.session import get_async_session_maker
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncEngine
 from portable_brain.common.services.llm_service.llm_client import TypedLLMProtocol
 from portable_brain.agent_service.common.types.llm_outputs.test_llm_outputs import TestLLMOutput
 from portable_brain.middleware.logging_middleware import LoggingMiddleware
 from portable_brain.common.services.droidrun_tools.droidrun_client import DroidRunClient
-from portable_brain.monitoring.background_tasks.observation_tracker import ObservationTracker
 
 from portable_brain.core.dependencies import (
     get_gemini_llm_client,
     get_nova_llm_client,
     get_main_db_engine,
-    get_droidrun_client,
-    get_observation_tracker
+    get_droidrun_client
 )
 
 # API
@@ -35,7 +35,8 @@ from portable_brain.api.routes.tests.retrieval_test_route import router as retri
 from portable_brain.api.routes.monitoring_background_tasks import router as monitoring_router
 
 # disable FastAPI docs for production/deployment
-is_local = get_service_settings().INCLUDE_DOCS
+settings = get_service_settings()
+is_local = settings.INCLUDE_DOCS
 logger.info(f"is_local (include FastAPI docs?): {is_local}")
 
 docs_config: dict[str, Any] = {
@@ -50,21 +51,33 @@ app = FastAPI(
     description="Experimental service for testing different memroy structures to observe HCI data",
     version="0.1.0",
     lifespan=lifespan,
+    # orjson for every route response (routers also set it), including / and /health
+    default_response_class=ORJSONResponse,
     **docs_config,  
 )
 
+# add logging middleware for requests
+app.add_middleware(LoggingMiddleware)
+
 # add CORS middleware
+# NOTE: added last so it's the outermost layer; preflight OPTIONS requests are answered before reaching logging.
+# NOTE: no credentials with wildcard origins (browsers reject that pairing anyway), so the allow-origin header is a static "*" rather than an echoed Origin + Vary.
 # TODO: make this more restrictive
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
-    allow_credentials=True,
+    allow_credentials=False,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
-# add logging middleware for requests
-app.add_middleware(LoggingMiddleware)
+# error responses for HTTPException (raised by routes for 4xx/5xx), serialized with orjson like the routers' responses
+@app.exception_handler(StarletteHTTPException)
+async def http_exception_handler(request: Request, exc: StarletteHTTPException) -> Response:
+    # NOTE: same contract as FastAPI's default handler, {"detail": ...} body and no body for 204/304
+    if exc.status_code in (204, 304):
+        return Response(status_code=exc.status_code, headers=exc.headers)
+    return ORJSONResponse({"detail": exc.detail}, status_code=exc.status_code, headers=exc.headers)
 
 # add routes
 # test routes
@@ -80,143 +93,138 @@ app.include_router(retrieval_test_router)
 app.include_router(monitoring_router)
 
 # test endpoint
+# NOTE: static body encoded once at import; / is cheap enough to serve as a load balancer probe
+_ROOT_BODY = b'{"message":"Hello World"}'
+
 @app.get("/", tags=["Application"])
 async def root():
-    return {"message": "Hello World"}
-
-# health endpoint
-@app.get("/health", tags=["Application"])
-async def health(
-    main_db_engine: AsyncEngine = Depends(get_main_db_engine),
-    gemini_llm_client: TypedLLMProtocol = Depends(get_gemini_llm_client),
-    nova_llm_client: TypedLLMProtocol = Depends(get_nova_llm_client),
-    droidrun_client: DroidRunClient = Depends(get_droidrun_client)
-):
-    """
-    Comprehensive health check for all services.
-    Checks all services independently and returns detailed status for each.
-    LLM checks are disabled by default in production to avoid API costs.
-    """
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
-    health_status = {
-        "status": "healthy",
-        "services": {}
-    }
+# health probes, each checks one service and reports (service key, status dict) without raising
+# NOTE: built once; the probe runs on a bare pooled connection, no ORM session or unit of work
+_DB_PING = text("SELECT 1")
 
-    # Check database connection (always enabled)
-    db_healthy = False
-    main_session_maker = get_async_session_maker(main_db_engine)
+async def _check_db(main_db_engine: AsyncEngine) -> tuple[str, dict[str, Any]]:
     try:
-        async with main_session_maker() as session:
-            await session.execute(text("SELECT 1"))
-        db_healthy = True
-        health_status["services"]["database"] = {
+        async with main_db_engine.connect() as conn:
+            await conn.scalar(_DB_PING)
+        logger.info("Database health check passed")
+        return "database", {
             "status": "healthy",
             "message": "Connected to main database"
         }
-        logger.info("Database health check passed")
     except Exception as e:
-        health_status["services"]["database"] = {
+        logger.error("Database health check failed: %s", e)
+        return "database", {
             "status": "unhealthy",
             "message": f"Unable to connect: {str(e)}"
         }
-        logger.error(f"Database health check failed: {e}")
 
-    # Check LLM connections (only if enabled via config)
-    gemini_healthy = True  # Default to true if check is disabled
-    nova_healthy = True    # Default to true if check is disabled
-    allow_llm_check = get_service_settings().HEALTH_CHECK_LLM
-
-    if allow_llm_check:
-        # Check Google Gemini
-        gemini_healthy = False
-        try:
-            gemini_response = await gemini_llm_client.acreate(
-                response_model=TestLLMOutput,
-                system_prompt="Are you connected?",
-                user_prompt="Respond with 'True'.",
-            )
-            gemini_healthy = True
-            health_status["services"]["gemini_llm"] = {
-                "status": "healthy",
-                "message": "Connected to Google Gemini LLM"
-            }
-            logger.info(f"Gemini LLM health check passed, response: {gemini_response}")
-        except Exception as e:
-            health_status["services"]["gemini_llm"] = {
-                "status": "unhealthy",
-                "message": f"Unable to connect: {str(e)}"
-            }
-            logger.error(f"Gemini LLM health check failed: {e}")
-
-        # Check Amazon Nova
-        nova_healthy = False
-        try:
-            nova_response = await nova_llm_client.acreate(
-                response_model=TestLLMOutput,
-                system_prompt="Are you connected?",
-                user_prompt="Respond with 'True'.",
-            )
-            nova_healthy = True
-            health_status["services"]["nova_llm"] = {
-                "status": "healthy",
-                "message": "Connected to Amazon Nova LLM"
-            }
-            logger.info(f"Nova LLM health check passed, response: {nova_response}")
-        except Exception as e:
-            health_status["services"]["nova_llm"] = {
-                "status": "unhealthy",
-                "message": f"Unable to connect: {str(e)}"
-            }
-            logger.error(f"Nova LLM health check failed: {e}")
-    else:
-        health_status["services"]["gemini_llm"] = {
-            "status": "skipped",
-            "message": "LLM health check disabled in production."
+async def _check_llm(llm_client: TypedLLMProtocol, key: str, label: str) -> tuple[str, dict[str, Any]]:
+    try:
+        response = await llm_client.acreate(
+            response_model=TestLLMOutput,
+            system_prompt="Are you connected?",
+            user_prompt="Respond with 'True'.",
+        )
+        logger.info("%s health check passed, response: %s", label, response)
+        return key, {
+            "status": "healthy",
+            "message": f"Connected to {label}"
         }
-        health_status["services"]["nova_llm"] = {
-            "status": "skipped",
-            "message": "LLM health check disabled in production."
+    except Exception as e:
+        logger.error("%s health check failed: %s", label, e)
+        return key, {
+            "status": "unhealthy",
+            "message": f"Unable to connect: {str(e)}"
         }
 
-    # Check DroidRun connection
-    droidrun_healthy = False
+async def _check_droidrun(droidrun_client: DroidRunClient) -> tuple[str, dict[str, Any]]:
     try:
         # Check if connected (should already have been established at startup)
         if not droidrun_client._connected:
-            health_status["services"]["droidrun"] = {
+            return "droidrun", {
                 "status": "unhealthy",
                 "message": "Not connected to device (failed at startup)",
                 "device_serial": droidrun_client.device_serial
             }
-        else:
-            # Simple ping to Portal to verify connection is still alive
-            ping_result = await droidrun_client.tools.ping()
-
-            # Get current device state for additional validation
-            state = await droidrun_client.get_current_state()
-            current_app = state['phone_state'].get('packageName', 'Unknown')
-
-            droidrun_healthy = True
-            health_status["services"]["droidrun"] = {
-                "status": "healthy",
-                "message": f"Connected to device {droidrun_client.device_serial}",
-                "current_app": current_app,
-                "portal_version": ping_result.get("version", "unknown"),
-                "DroidAgent": "healthy" if droidrun_client.llm and not droidrun_client.disable_llm else "disabled"
-            }
-            logger.info(f"DroidRun health check passed, current app: {current_app}")
 
+        # Ping Portal to verify connection is still alive, and get current device state for additional validation
+        ping_result, state = await asyncio.gather(
+            droidrun_client.tools.ping(),
+            droidrun_client.get_current_state(),
+        )
+        current_app = state['phone_state'].get('packageName', 'Unknown')
+
+        logger.info("DroidRun health check passed, current app: %s", current_app)
+        return "droidrun", {
+            "status": "healthy",
+            "message": f"Connected to device {droidrun_client.device_serial}",
+            "current_app": current_app,
+            "portal_version": ping_result.get("version", "unknown"),
+            "DroidAgent": "healthy" if droidrun_client.llm and not droidrun_client.disable_llm else "disabled"
+        }
     except Exception as e:
-        health_status["services"]["droidrun"] = {
+        logger.error("DroidRun health check failed: %s", e)
+        return "droidrun", {
             "status": "unhealthy",
             "message": f"Connection lost or error: {str(e)}",
             "device_serial": droidrun_client.device_serial
         }
-        logger.error(f"DroidRun health check failed: {e}")
 
-    # Set overall status based on all service checks
-    if not (db_healthy and gemini_healthy and nova_healthy and droidrun_healthy):
-        health_status["status"] = "unhealthy"
+# hard deadline per probe, so one hanging service can't stall /health
+# NOTE: generous enough for a real LLM round trip when HEALTH_CHECK_LLM is on
+_HEALTH_PROBE_TIMEOUT_S = 5.0
+
+async def _with_deadline(key: str, probe: Awaitable[tuple[str, dict[str, Any]]]) -> tuple[str, dict[str, Any]]:
+    try:
+        async with asyncio.timeout(_HEALTH_PROBE_TIMEOUT_S):
+            return await probe
+    except TimeoutError:
+        logger.error("%s health check timed out after %.1fs", key, _HEALTH_PROBE_TIMEOUT_S)
+        return key, {
+            "status": "unhealthy",
+            "message": f"Timed out after {_HEALTH_PROBE_TIMEOUT_S}s"
+        }
+
+# health endpoint
+@app.get("/health", tags=["Application"])
+async def health(
+    main_db_engine: AsyncEngine = Depends(get_main_db_engine),
+    gemini_llm_client: TypedLLMProtocol = Depends(get_gemini_llm_client),
+    nova_llm_client: TypedLLMProtocol = Depends(get_nova_llm_client),
+    droidrun_client: DroidRunClient = Depends(get_droidrun_client)
+):
+    """
+    Comprehensive health check for all services.
+    Checks all services independently and concurrently, and returns detailed status for each.
+    LLM checks are disabled by default in production to avoid API costs.
+    """
+    services: dict[str, dict[str, Any]] = {}
+    probes = [("database", _check_db(main_db_engine)), ("droidrun", _check_droidrun(droidrun_client))]
+
+    # Check LLM connections (only if enabled via config)
+    if settings.HEALTH_CHECK_LLM:
+        probes.append(("gemini_llm", _check_llm(gemini_llm_client, "gemini_llm", "Google Gemini LLM")))
+        probes.append(("nova_llm", _check_llm(nova_llm_client, "nova_llm", "Amazon Nova LLM")))
+    else:
+        for key in ("gemini_llm", "nova_llm"):
+            services[key] = {
+                "status": "skipped",
+                "message": "LLM health check disabled in production."
+            }
+
+    # NOTE: probes run concurrently and catch their own errors, so total latency is the slowest probe (capped by the deadline) rather than the sum
+    # the task group guarantees no probe task outlives the request, e.g. if the client disconnects mid-check
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(_with_deadline(key, probe)) for key, probe in probes]
+    for task in tasks:
+        key, service_status = task.result()
+        services[key] = service_status
 
-    return health_status
+    # Set overall status based on all service checks
+    overall = "unhealthy" if any(v["status"] == "unhealthy" for v in services.values()) else "healthy"
+    return {
+        "status": overall,
+        "services": {key: services[key] for key in ("database", "gemini_llm", "nova_llm", "droidrun")}
+    }
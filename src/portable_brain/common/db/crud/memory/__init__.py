@@ -1 +1,6 @@
-# crud operations for memory data structures in db representation
\ No newline at end of file
+# NOTE: every CRUD helper takes an optional caller-managed `session: AsyncSession | None = None`.
+# - Without one, the helper opens its own session (and, for writes, its own transaction).
+# - With one, the helper runs on it and never commits; the caller owns the transaction, so a batch of writes costs one BEGIN/COMMIT:
+#       async with get_async_session_maker(main_db_engine)() as session, session.begin():
+#           await save_text_embedding_logs(logs, main_db_engine, session=session)
+#           await save_observations_to_structured_memory(observations, main_db_engine, session=session)
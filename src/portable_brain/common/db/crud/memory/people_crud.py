@@ -1,6 +1,7 @@
 # CRUD for interpersonal_relationships memory
-from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 from sqlalchemy import select, func
+from sqlalchemy.orm import defer
 from portable_brain.common.db.models.memory.people import InterpersonalRelationship
 from portable_brain.common.db.session import get_async_session_maker
 from portable_brain.common.logging.logger import logger
@@ -18,6 +19,7 @@ async def save_person_relationship(
     platform: Optional[str] = None,
     platform_handle: Optional[str] = None,
     created_at: Optional[datetime] = None,
+    session: AsyncSession | None = None,
 ) -> None:
     """
     Persist a new interpersonal relationship record to the database.
@@ -34,27 +36,31 @@ async def save_person_relationship(
         platform: Communication platform e.g. "instagram", "email" (optional)
         platform_handle: Handle on that platform e.g. "@sarah" (optional)
         created_at: Timestamp (defaults to now)
+        session: Optional caller-managed session; the record is added to its transaction and the caller commits
     """
-    session_maker = get_async_session_maker(main_db_engine)
     now = created_at or datetime.now()
 
+    async def _save(session: AsyncSession) -> None:
+        record = InterpersonalRelationship(
+            id=person_id,
+            first_name=first_name,
+            last_name=last_name,
+            full_name=full_name,
+            platform=platform,
+            platform_handle=platform_handle,
+            relationship_description=relationship_description,
+            relationship_vector=relationship_vector,
+            created_at=now,
+            updated_at=now,
+        )
+        session.add(record)
+        logger.info(f"Saved person relationship for '{full_name}' (id={person_id})")
+
     try:
-        async with session_maker() as session:
-            record = InterpersonalRelationship(
-                id=person_id,
-                first_name=first_name,
-                last_name=last_name,
-                full_name=full_name,
-                platform=platform,
-                platform_handle=platform_handle,
-                relationship_description=relationship_description,
-                relationship_vector=relationship_vector,
-                created_at=now,
-                updated_at=now,
-            )
-            session.add(record)
-            await session.commit()
-            logger.info(f"Saved person relationship for '{full_name}' (id={person_id})")
+        if session is not None:
+            return await _save(session)
+        async with get_async_session_maker(main_db_engine)() as session, session.begin():
+            await _save(session)
     except Exception as e:
         logger.error(f"Failed to save person relationship for '{full_name}': {e}")
         raise
@@ -63,6 +69,7 @@ async def save_person_relationship(
 async def get_person_by_id(
     person_id: str,
     main_db_engine: AsyncEngine,
+    session: AsyncSession | None = None,
 ) -> Optional[InterpersonalRelationship]:
     """
     Retrieve an interpersonal relationship record by its primary key.
@@ -70,17 +77,18 @@ async def get_person_by_id(
     Args:
         person_id: The person's unique identifier
         main_db_engine: Async database engine
+        session: Optional caller-managed session
 
     Returns:
         InterpersonalRelationship or None if not found
     """
-    session_maker = get_async_session_maker(main_db_engine)
+    stmt = select(InterpersonalRelationship).where(InterpersonalRelationship.id == person_id)
 
     try:
-        async with session_maker() as session:
-            stmt = select(InterpersonalRelationship).where(InterpersonalRelationship.id == person_id)
-            result = await session.execute(stmt)
-            return result.scalar_one_or_none()
+        if session is not None:
+            return (await session.execute(stmt)).scalar_one_or_none()
+        async with get_async_session_maker(main_db_engine)() as session:
+            return (await session.execute(stmt)).scalar_one_or_none()
     except Exception as e:
         logger.error(f"Failed to get person by id '{person_id}': {e}")
         raise
@@ -91,6 +99,7 @@ async def find_person_by_name(
     main_db_engine: AsyncEngine,
     similarity_threshold: float = 0.3,
     limit: int = 10,
+    session: AsyncSession | None = None,
 ) -> list[dict]:
     """
     Fuzzy name lookup using PostgreSQL trigram similarity (pg_trgm).
@@ -101,36 +110,41 @@ async def find_person_by_name(
         main_db_engine: Async database engine
         similarity_threshold: Minimum similarity score 0–1 to include a result (default 0.3)
         limit: Maximum number of results to return
+        session: Optional caller-managed session
 
     Returns:
         List of dicts with keys: full_name, relationship_description, similarity_score
     """
-    session_maker = get_async_session_maker(main_db_engine)
     similarity = func.similarity(InterpersonalRelationship.full_name, name)
 
-    try:
-        async with session_maker() as session:
-            stmt = (
-                select(
-                    InterpersonalRelationship.full_name,
-                    InterpersonalRelationship.relationship_description,
-                    similarity.label("similarity_score"),
-                )
-                .filter(similarity > similarity_threshold)
-                .order_by(similarity.desc())
-                .limit(limit)
+    async def _find(session: AsyncSession) -> list[dict]:
+        stmt = (
+            select(
+                InterpersonalRelationship.full_name,
+                InterpersonalRelationship.relationship_description,
+                similarity.label("similarity_score"),
             )
-            result = await session.execute(stmt)
-            rows = result.all()
-            logger.info(f"Found {len(rows)} people matching name '{name}'")
-            return [
-                {
-                    "full_name": row[0],
-                    "relationship_description": row[1],
-                    "similarity_score": row[2],
-                }
-                for row in rows
-            ]
+            .filter(similarity > similarity_threshold)
+            .order_by(similarity.desc())
+            .limit(limit)
+        )
+        result = await session.execute(stmt)
+        rows = result.all()
+        logger.info(f"Found {len(rows)} people matching name '{name}'")
+        return [
+            {
+                "full_name": row[0],
+                "relationship_description": row[1],
+                "similarity_score": row[2],
+            }
+            for row in rows
+        ]
+
+    try:
+        if session is not None:
+            return await _find(session)
+        async with get_async_session_maker(main_db_engine)() as session:
+            return await _find(session)
     except Exception as e:
         logger.error(f"Failed to find person by name '{name}': {e}")
         raise
@@ -140,6 +154,7 @@ async def find_similar_relationships(
     query_vector: list[float],
     limit: int,
     main_db_engine: AsyncEngine,
+    session: AsyncSession | None = None,
 ) -> list[tuple[InterpersonalRelationship, float]]:
     """
     Find the most semantically similar relationship descriptions using cosine distance.
@@ -148,26 +163,32 @@ async def find_similar_relationships(
         query_vector: The query embedding vector
         limit: Maximum number of results to return
         main_db_engine: Async database engine
+        session: Optional caller-managed session
 
     Returns:
-        List of tuples (InterpersonalRelationship, cosine_distance)
+        List of tuples (InterpersonalRelationship, cosine_distance), with relationship_vector left unloaded
     """
-    session_maker = get_async_session_maker(main_db_engine)
+    async def _find(session: AsyncSession) -> list[tuple[InterpersonalRelationship, float]]:
+        stmt = (
+            select(
+                InterpersonalRelationship,
+                InterpersonalRelationship.relationship_vector.cosine_distance(query_vector).label("distance")
+            )
+            .order_by("distance")
+            .limit(limit)
+            # NOTE: relationship_vector is only needed server-side for the distance, so it's not fetched back
+            .options(defer(InterpersonalRelationship.relationship_vector, raiseload=True))
+        )
+        result = await session.execute(stmt)
+        rows = result.all()
+        logger.info(f"Found {len(rows)} similar person relationships")
+        return [(row[0], row[1]) for row in rows]
 
     try:
-        async with session_maker() as session:
-            stmt = (
-                select(
-                    InterpersonalRelationship,
-                    InterpersonalRelationship.relationship_vector.cosine_distance(query_vector).label("distance")
-                )
-                .order_by("distance")
-                .limit(limit)
-            )
-            result = await session.execute(stmt)
-            rows = result.all()
-            logger.info(f"Found {len(rows)} similar person relationships")
-            return [(row[0], row[1]) for row in rows]
+        if session is not None:
+            return await _find(session)
+        async with get_async_session_maker(main_db_engine)() as session:
+            return await _find(session)
     except Exception as e:
         logger.error(f"Failed to find similar relationships: {e}")
         raise
@@ -2,9 +2,9 @@
 
 # sqlalchemy
 from sqlalchemy.orm import Session
-from sqlalchemy import select, func, text
-from sqlalchemy.ext.asyncio import AsyncEngine
-from typing import Optional
+from sqlalchemy import select, insert, func, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from typing import Any, Callable, Optional
 
 # Canonical DTOs for db model and observation
 from portable_brain.common.db.models.memory.structured_storage import StructuredMemory, ObservationEntity
@@ -20,74 +20,129 @@ from portable_brain.common.db.session import get_async_session_maker
 # logger
 from portable_brain.common.logging.logger import logger
 
-async def save_observation_to_structured_memory(observation: Observation, main_db_engine: AsyncEngine) -> None:
+def _people_observation_row(observation: LongTermPeopleObservation) -> dict[str, Any]:
+    return dict(
+        id=observation.id,
+        memory_type=observation.memory_type.value,
+        node_content=observation.node,
+        edge_type=observation.edge,
+        source_entity_id="me",
+        source_entity_type="user",
+        target_entity_id=observation.target_id,
+        target_entity_type="person",
+        created_at=observation.created_at,
+        updated_at=observation.created_at,
+        importance=observation.importance,
+        recurrence=1,
+    )
+
+def _preferences_observation_row(observation: LongTermPreferencesObservation | ShortTermPreferencesObservation) -> dict[str, Any]:
+    return dict(
+        id=observation.id,
+        memory_type=observation.memory_type.value,
+        node_content=observation.node,
+        edge_type=observation.edge,
+        source_entity_id=observation.source_id,
+        source_entity_type="app",
+        target_entity_id=None,
+        target_entity_type=None,
+        created_at=observation.created_at,
+        updated_at=observation.created_at,
+        importance=observation.importance,
+        recurrence=observation.recurrence,
+    )
+
+def _content_observation_row(observation: ShortTermContentObservation) -> dict[str, Any]:
+    return dict(
+        id=observation.id,
+        memory_type=observation.memory_type.value,
+        node_content=observation.node,
+        edge_type=None,
+        source_entity_id=observation.source_id,
+        source_entity_type="content_source",
+        target_entity_id=observation.content_id,
+        target_entity_type="content",
+        created_at=observation.created_at,
+        updated_at=observation.created_at,
+        importance=observation.importance,
+        recurrence=1,
+    )
+
+# row factory per concrete observation subtype, looked up by exact type instead of an isinstance chain
+_ROW_FACTORIES: dict[type, Callable[[Any], dict[str, Any]]] = {
+    LongTermPeopleObservation: _people_observation_row,
+    LongTermPreferencesObservation: _preferences_observation_row,
+    ShortTermPreferencesObservation: _preferences_observation_row,
+    ShortTermContentObservation: _content_observation_row,
+}
+
+def _observation_to_row(observation: Observation) -> dict[str, Any]:
     """
-    Helper to save observation node to structured memory in SQL db.
-    - Parses Observation DTO into StructuredMemory ORM based on observation subtype.
-    - Uses async sessionmaker to create session.
-    - SQLAlchemy allows ORM mapped operations.
+    Pure helper to parse an Observation DTO into StructuredMemory column values based on observation subtype.
+    - Returns a plain row dict for Core-style inserts; every subtype sets the same keys, so rows can be bulk-bound together.
+    - Raises TypeError for unsupported observation types.
     """
-
-    # Parse Observation DTO into StructuredMemory ORM by subtype case work
-    if isinstance(observation, LongTermPeopleObservation):
-        orm_obj = StructuredMemory(
-            id=observation.id,
-            memory_type=observation.memory_type.value,
-            node_content=observation.node,
-            edge_type=observation.edge,
-            source_entity_id="me",
-            source_entity_type="user",
-            target_entity_id=observation.target_id,
-            target_entity_type="person",
-            created_at=observation.created_at,
-            updated_at=observation.created_at,
-            importance=observation.importance,
-            recurrence=1,
-        )
-    elif isinstance(observation, (LongTermPreferencesObservation, ShortTermPreferencesObservation)):
-        orm_obj = StructuredMemory(
-            id=observation.id,
-            memory_type=observation.memory_type.value,
-            node_content=observation.node,
-            edge_type=observation.edge,
-            source_entity_id=observation.source_id,
-            source_entity_type="app",
-            target_entity_id=None,
-            target_entity_type=None,
-            created_at=observation.created_at,
-            updated_at=observation.created_at,
-            importance=observation.importance,
-            recurrence=observation.recurrence,
-        )
-    elif isinstance(observation, ShortTermContentObservation):
-        orm_obj = StructuredMemory(
-            id=observation.id,
-            memory_type=observation.memory_type.value,
-            node_content=observation.node,
-            edge_type=None,
-            source_entity_id=observation.source_id,
-            source_entity_type="content_source",
-            target_entity_id=observation.content_id,
-            target_entity_type="content",
-            created_at=observation.created_at,
-            updated_at=observation.created_at,
-            importance=observation.importance,
-            recurrence=1,
-        )
-    else:
+    factory = _ROW_FACTORIES.get(type(observation))
+    if factory is None:
         logger.error(f"Unsupported observation type: {type(observation)}")
         raise TypeError(f"Unsupported observation type: {type(observation)}")
+    return factory(observation)
+
+async def save_observation_to_structured_memory(
+    observation: Observation,
+    main_db_engine: AsyncEngine,
+    session: AsyncSession | None = None,
+) -> None:
+    """
+    Helper to save observation node to structured memory in SQL db.
+    - Parses Observation DTO into StructuredMemory column values based on observation subtype.
+    - Uses async sessionmaker to create session, unless a caller-managed session is passed (the caller then commits).
+    - NOTE: a single INSERT statement rather than session.add(); a write-only row doesn't need the unit of work / identity map.
+    """
+    row = _observation_to_row(observation)
+
+    async def _save(session: AsyncSession) -> None:
+        await session.execute(insert(StructuredMemory).values(**row))
+        logger.info(f"Saved observation {observation.id} to structured memory")
 
-    session_maker = get_async_session_maker(main_db_engine)
     try:
-        async with session_maker() as session:
-            session.add(orm_obj)
-            await session.commit()
-            logger.info(f"Saved observation {observation.id} to structured memory")
+        if session is not None:
+            return await _save(session)
+        async with get_async_session_maker(main_db_engine)() as session, session.begin():
+            await _save(session)
     except Exception as e:
         logger.error(f"Failed to save observation to structured memory: {e}")
         raise
 
+async def save_observations_to_structured_memory(
+    observations: list[Observation],
+    main_db_engine: AsyncEngine,
+    session: AsyncSession | None = None,
+) -> None:
+    """
+    Batch variant of save_observation_to_structured_memory.
+    - All observations are inserted in one session and committed in a single transaction (one round-trip/WAL flush instead of N).
+    - Rows are passed as an executemany parameter list, so the INSERT is compiled once and bulk-bound.
+    - Conversion happens up front, so an unsupported observation type fails the batch before anything is written.
+    - With a caller-managed session, the insert joins the caller's transaction and the caller commits.
+    """
+    if not observations:
+        return
+    rows = [_observation_to_row(observation) for observation in observations]
+
+    async def _save(session: AsyncSession) -> None:
+        await session.execute(insert(StructuredMemory), rows)
+        logger.info(f"Saved {len(rows)} observations to structured memory")
+
+    try:
+        if session is not None:
+            return await _save(session)
+        async with get_async_session_maker(main_db_engine)() as session, session.begin():
+            await _save(session)
+    except Exception as e:
+        logger.error(f"Failed to save observations to structured memory: {e}")
+        raise
+
 
 # =====================================================================
 # READ operations for memory retrieval
@@ -99,6 +154,7 @@ async def get_observations_by_memory_type(
     source_entity_id: Optional[str] = None,
     target_entity_id: Optional[str] = None,
     limit: int = 10,
+    session: AsyncSession | None = None,
 ) -> list[StructuredMemory]:
     """
     Retrieve observations filtered by memory type, optionally by source/target entity.
@@ -110,19 +166,20 @@ async def get_observations_by_memory_type(
         source_entity_id: Optional filter by source entity (app package, "me", etc.)
         target_entity_id: Optional filter by target entity (person name, content id, etc.)
         limit: Max results
+        session: Optional caller-managed session
     """
-    session_maker = get_async_session_maker(main_db_engine)
+    stmt = select(StructuredMemory).where(StructuredMemory.memory_type == memory_type)
+    if source_entity_id:
+        stmt = stmt.where(StructuredMemory.source_entity_id == source_entity_id)
+    if target_entity_id:
+        stmt = stmt.where(StructuredMemory.target_entity_id == target_entity_id)
+    stmt = stmt.order_by(StructuredMemory.relevance_score.desc()).limit(limit)
+
     try:
-        async with session_maker() as session:
-            stmt = select(StructuredMemory).where(StructuredMemory.memory_type == memory_type)
-            if source_entity_id:
-                stmt = stmt.where(StructuredMemory.source_entity_id == source_entity_id)
-            if target_entity_id:
-                stmt = stmt.where(StructuredMemory.target_entity_id == target_entity_id)
-            stmt = stmt.order_by(StructuredMemory.relevance_score.desc()).limit(limit)
-
-            result = await session.execute(stmt)
-            return list(result.scalars().all())
+        if session is not None:
+            return list((await session.scalars(stmt)).all())
+        async with get_async_session_maker(main_db_engine)() as session:
+            return list((await session.scalars(stmt)).all())
     except Exception as e:
         logger.error(f"Failed to get observations by memory type '{memory_type}': {e}")
         raise
@@ -133,6 +190,7 @@ async def get_observations_by_entity(
     main_db_engine: AsyncEngine,
     entity_type: Optional[str] = None,
     limit: int = 10,
+    session: AsyncSession | None = None,
 ) -> list[StructuredMemory]:
     """
     Find all observations mentioning a specific entity via the ObservationEntity junction table.
@@ -143,21 +201,22 @@ async def get_observations_by_entity(
         main_db_engine: Async database engine
         entity_type: Optional filter by entity type ("person", "app", "content_source", etc.)
         limit: Max results
+        session: Optional caller-managed session
     """
-    session_maker = get_async_session_maker(main_db_engine)
+    stmt = (
+        select(StructuredMemory)
+        .join(ObservationEntity, ObservationEntity.observation_id == StructuredMemory.id)
+        .where(ObservationEntity.entity_id == entity_id)
+    )
+    if entity_type:
+        stmt = stmt.where(ObservationEntity.entity_type == entity_type)
+    stmt = stmt.order_by(StructuredMemory.relevance_score.desc()).limit(limit)
+
     try:
-        async with session_maker() as session:
-            stmt = (
-                select(StructuredMemory)
-                .join(ObservationEntity, ObservationEntity.observation_id == StructuredMemory.id)
-                .where(ObservationEntity.entity_id == entity_id)
-            )
-            if entity_type:
-                stmt = stmt.where(ObservationEntity.entity_type == entity_type)
-            stmt = stmt.order_by(StructuredMemory.relevance_score.desc()).limit(limit)
-
-            result = await session.execute(stmt)
-            return list(result.scalars().all())
+        if session is not None:
+            return list((await session.scalars(stmt)).all())
+        async with get_async_session_maker(main_db_engine)() as session:
+            return list((await session.scalars(stmt)).all())
     except Exception as e:
         logger.error(f"Failed to get observations by entity '{entity_id}': {e}")
         raise
@@ -168,6 +227,7 @@ async def fulltext_search_observations(
     main_db_engine: AsyncEngine,
     memory_type: Optional[str] = None,
     limit: int = 10,
+    session: AsyncSession | None = None,
 ) -> list[tuple[StructuredMemory, float]]:
     """
     Full-text search across observation node_content using PostgreSQL tsvector.
@@ -178,24 +238,29 @@ async def fulltext_search_observations(
         main_db_engine: Async database engine
         memory_type: Optional filter by memory type
         limit: Max results
+        session: Optional caller-managed session
     """
-    session_maker = get_async_session_maker(main_db_engine)
+    ts_query = func.plainto_tsquery("english", search_query)
+    stmt = (
+        select(
+            StructuredMemory,
+            func.ts_rank(StructuredMemory.search_vector, ts_query).label("rank"),
+        )
+        .where(StructuredMemory.search_vector.op("@@")(ts_query))
+    )
+    if memory_type:
+        stmt = stmt.where(StructuredMemory.memory_type == memory_type)
+    stmt = stmt.order_by(text("rank DESC")).limit(limit)
+
+    async def _search(session: AsyncSession) -> list[tuple[StructuredMemory, float]]:
+        result = await session.execute(stmt)
+        return [(row[0], row[1]) for row in result.all()]
+
     try:
-        async with session_maker() as session:
-            ts_query = func.plainto_tsquery("english", search_query)
-            stmt = (
-                select(
-                    StructuredMemory,
-                    func.ts_rank(StructuredMemory.search_vector, ts_query).label("rank"),
-                )
-                .where(StructuredMemory.search_vector.op("@@")(ts_query))
-            )
-            if memory_type:
-                stmt = stmt.where(StructuredMemory.memory_type == memory_type)
-            stmt = stmt.order_by(text("rank DESC")).limit(limit)
-
-            result = await session.execute(stmt)
-            return [(row[0], row[1]) for row in result.all()]
+        if session is not None:
+            return await _search(session)
+        async with get_async_session_maker(main_db_engine)() as session:
+            return await _search(session)
     except Exception as e:
         logger.error(f"Failed to fulltext search observations: {e}")
         raise
@@ -205,6 +270,7 @@ async def get_most_relevant_observations(
     main_db_engine: AsyncEngine,
     memory_type: Optional[str] = None,
     limit: int = 10,
+    session: AsyncSession | None = None,
 ) -> list[StructuredMemory]:
     """
     Retrieve highest-relevance observations (importance * recurrence).
@@ -214,17 +280,18 @@ async def get_most_relevant_observations(
         main_db_engine: Async database engine
         memory_type: Optional filter by memory type
         limit: Max results
+        session: Optional caller-managed session
     """
-    session_maker = get_async_session_maker(main_db_engine)
+    stmt = select(StructuredMemory)
+    if memory_type:
+        stmt = stmt.where(StructuredMemory.memory_type == memory_type)
+    stmt = stmt.order_by(StructuredMemory.relevance_score.desc()).limit(limit)
+
     try:
-        async with session_maker() as session:
-            stmt = select(StructuredMemory)
-            if memory_type:
-                stmt = stmt.where(StructuredMemory.memory_type == memory_type)
-            stmt = stmt.order_by(StructuredMemory.relevance_score.desc()).limit(limit)
-
-            result = await session.execute(stmt)
-            return list(result.scalars().all())
+        if session is not None:
+            return list((await session.scalars(stmt)).all())
+        async with get_async_session_maker(main_db_engine)() as session:
+            return list((await session.scalars(stmt)).all())
     except Exception as e:
         logger.error(f"Failed to get most relevant observations: {e}")
         raise
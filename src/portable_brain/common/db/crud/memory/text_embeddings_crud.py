@@ -1,6 +1,7 @@
 # CRUD operations for text embeddings with pgvector
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
-from sqlalchemy import select, text
+from sqlalchemy import select, insert, delete, text
+from sqlalchemy.orm import defer
 from portable_brain.common.db.models.memory.text_embeddings import TextEmbeddingLogs
 from portable_brain.common.db.session import get_async_session_maker
 from portable_brain.common.logging.logger import logger
@@ -13,10 +14,12 @@ async def save_text_embedding_log(
     observation_text: str,
     embedding_vector: list[float],
     main_db_engine: AsyncEngine,
-    created_at: Optional[datetime] = None
+    created_at: Optional[datetime] = None,
+    session: AsyncSession | None = None
 ) -> None:
     """
     Save a new text embedding log to the database.
+    NOTE: thin wrapper over save_text_embedding_logs with a single row.
 
     Args:
         observation_id: Unique identifier for the observation
@@ -24,30 +27,68 @@ async def save_text_embedding_log(
         embedding_vector: The embedding vector (list of floats)
         main_db_engine: Async database engine
         created_at: Optional timestamp (defaults to now)
+        session: Optional caller-managed session; the insert joins its transaction and the caller commits
     """
-    session_maker = get_async_session_maker(main_db_engine)
+    await save_text_embedding_logs(
+        [(observation_id, observation_text, embedding_vector)],
+        main_db_engine=main_db_engine,
+        created_at=created_at,
+        session=session,
+    )
+
+async def save_text_embedding_logs(
+    logs: list[tuple[str, str, list[float]]],
+    main_db_engine: AsyncEngine,
+    created_at: Optional[datetime] = None,
+    session: AsyncSession | None = None
+) -> None:
+    """
+    Save a batch of text embedding logs in a single transaction.
+    - Rows are passed to one INSERT as an executemany parameter list, so the statement is compiled and prepared once
+      and asyncpg pipelines the rows instead of paying a round trip (and a commit) each.
+    - No ORM objects are built; the rows are write-only.
+
+    Args:
+        logs: List of (observation_id, observation_text, embedding_vector) tuples
+        main_db_engine: Async database engine
+        created_at: Optional timestamp shared by every row (defaults to now)
+        session: Optional caller-managed session; the insert joins its transaction and the caller commits
+    """
+    if not logs:
+        return
+    created_at = created_at or datetime.now()
+    rows = [
+        {
+            "id": observation_id,
+            "observation_text": observation_text,
+            "embedding_vector": embedding_vector,
+            "observation_id": observation_id,
+            "created_at": created_at,
+        }
+        for observation_id, observation_text, embedding_vector in logs
+    ]
+
+    async def _save(session: AsyncSession) -> None:
+        await session.execute(insert(TextEmbeddingLogs), rows)
+        logger.info(f"Saved {len(rows)} text embeddings")
 
     try:
-        async with session_maker() as session:
-            embedding = TextEmbeddingLogs(
-                id=observation_id,
-                observation_text=observation_text,
-                embedding_vector=embedding_vector,
-                observation_id=observation_id,
-                created_at=created_at or datetime.now()
-            )
-            session.add(embedding)
-            await session.commit()
-            logger.info(f"Saved text embedding for observation {observation_id}")
+        if session is not None:
+            return await _save(session)
+        async with get_async_session_maker(main_db_engine)() as session, session.begin():
+            await _save(session)
     except Exception as e:
-        logger.error(f"Failed to save text embedding: {e}")
+        logger.error(f"Failed to save text embeddings: {e}")
         raise
 
 async def find_similar_embeddings(
     query_vector: list[float],
     limit: int,
     main_db_engine: AsyncEngine,
-    distance_metric: str = "cosine" # "cosine", "l2", or "inner_product"
+    distance_metric: str = "cosine", # "cosine", "l2", or "inner_product"
+    session: AsyncSession | None = None,
+    ef_search: int | None = None,
+    include_vector: bool = False
 ) -> list[tuple[TextEmbeddingLogs, float]]:
     """
     Find the most similar embeddings using vector similarity search.
@@ -58,12 +99,16 @@ async def find_similar_embeddings(
         limit: Maximum number of results to return
         main_db_engine: Async database engine
         distance_metric: Distance metric to use ("cosine", "l2", or "inner_product")
+            NOTE: only cosine is backed by the HNSW index (halfvec_cosine_ops); the others scan the table.
+        session: Optional caller-managed session (e.g. one whose connection was checked out while the query vector was being embedded)
+        ef_search: Optional HNSW candidate list size for this query (server default 40); higher trades latency for recall.
+            Only affects the cosine metric, the one the HNSW index is built for.
+        include_vector: Also fetch embedding_vector for each hit. Off by default, since the vector is most of the row's bytes
+            and callers usually only need the text and distance; when off, the returned records leave embedding_vector unloaded.
 
     Returns:
         List of tuples (TextEmbedding, distance)
     """
-    session_maker = get_async_session_maker(main_db_engine)
-
     # Choose distance function based on metric
     distance_functions = {
         "cosine": TextEmbeddingLogs.embedding_vector.cosine_distance,
@@ -76,23 +121,40 @@ async def find_similar_embeddings(
 
     distance_func = distance_functions[distance_metric]
 
-    try:
-        async with session_maker() as session:
-            # Build query with distance calculation
-            stmt = (
-                select(
-                    TextEmbeddingLogs,
-                    distance_func(query_vector).label("distance")
-                )
-                .order_by("distance")
-                .limit(limit)
+    async def _find(session: AsyncSession) -> list[tuple[TextEmbeddingLogs, float]]:
+        if ef_search is not None:
+            # NOTE: set_config(..., is_local=true) is SET LOCAL with a bindable value; it only lasts for the current transaction
+            await session.execute(
+                text("SELECT set_config('hnsw.ef_search', :ef_search, true)"),
+                {"ef_search": str(ef_search)},
+            )
+        # Build query with distance calculation
+        # NOTE: ORDER BY spells out the distance operator (not the label) so it visibly matches the HNSW index expression;
+        # it's the same bind parameter object, so the query vector is still sent once
+        distance = distance_func(query_vector)
+        stmt = (
+            select(
+                TextEmbeddingLogs,
+                distance.label("distance")
             )
+            .order_by(distance)
+            .limit(limit)
+        )
+        if not include_vector:
+            # NOTE: the vector is still used server-side for the distance, it's just not shipped back and decoded per row
+            stmt = stmt.options(defer(TextEmbeddingLogs.embedding_vector, raiseload=True))
 
-            result = await session.execute(stmt)
-            results = result.all()
+        result = await session.execute(stmt)
+        results = result.all()
 
-            logger.info(f"Found {len(results)} similar embeddings")
-            return [(row[0], row[1]) for row in results]
+        logger.info(f"Found {len(results)} similar embeddings")
+        return [(row[0], row[1]) for row in results]
+
+    try:
+        if session is not None:
+            return await _find(session)
+        async with get_async_session_maker(main_db_engine)() as session:
+            return await _find(session)
 
     except Exception as e:
         logger.error(f"Failed to find similar embeddings: {e}")
@@ -100,7 +162,8 @@ async def find_similar_embeddings(
 
 async def get_embedding_by_observation_id(
     observation_id: str,
-    main_db_engine: AsyncEngine
+    main_db_engine: AsyncEngine,
+    session: AsyncSession | None = None
 ) -> Optional[TextEmbeddingLogs]:
     """
     Retrieve a text embedding by observation ID.
@@ -108,18 +171,17 @@ async def get_embedding_by_observation_id(
     Args:
         observation_id: The observation identifier
         main_db_engine: Async database engine
+        session: Optional caller-managed session
 
     Returns:
         TextEmbedding or None if not found
     """
-    session_maker = get_async_session_maker(main_db_engine)
-
     try:
-        async with session_maker() as session:
-            stmt = select(TextEmbeddingLogs).where(TextEmbeddingLogs.id == observation_id)
-            result = await session.execute(stmt)
-            embedding = result.scalar_one_or_none()
-            return embedding
+        # primary key lookup
+        if session is not None:
+            return await session.get(TextEmbeddingLogs, observation_id)
+        async with get_async_session_maker(main_db_engine)() as session:
+            return await session.get(TextEmbeddingLogs, observation_id)
     except Exception as e:
         logger.error(f"Failed to get embedding by ID: {e}")
         raise
@@ -129,10 +191,12 @@ async def find_similar_texts(
     limit: int,
     main_db_engine: AsyncEngine,
     distance_metric: str = "cosine", # "cosine", "l2", or "inner_product"
+    session: AsyncSession | None = None,
 ) -> list[str]:
     """
     Find observation texts most similar to the query vector.
     NOTE: more minimal than above helper, returns just the list[str] texts found.
+    - Pass session to run on a caller-managed session.
 
     Returns:
         List of observation_text strings ordered by similarity
@@ -146,24 +210,25 @@ async def find_similar_texts(
     if distance_metric not in distance_functions:
         raise ValueError(f"Invalid distance metric: {distance_metric}. Use 'cosine', 'l2', or 'inner_product'")
 
-    session_maker = get_async_session_maker(main_db_engine)
+    stmt = (
+        select(TextEmbeddingLogs.observation_text)
+        .order_by(distance_functions[distance_metric](query_vector))
+        .limit(limit)
+    )
 
     try:
-        async with session_maker() as session:
-            stmt = (
-                select(TextEmbeddingLogs.observation_text)
-                .order_by(distance_functions[distance_metric](query_vector))
-                .limit(limit)
-            )
-            result = await session.execute(stmt)
-            return list(result.scalars().all())
+        if session is not None:
+            return list((await session.scalars(stmt)).all())
+        async with get_async_session_maker(main_db_engine)() as session:
+            return list((await session.scalars(stmt)).all())
     except Exception as e:
         logger.error(f"Failed to find similar texts: {e}")
         raise
 
 async def delete_embedding_by_observation_id(
     observation_id: str,
-    main_db_engine: AsyncEngine
+    main_db_engine: AsyncEngine,
+    session: AsyncSession | None = None
 ) -> bool:
     """
     Delete a text embedding by observation ID.
@@ -171,26 +236,32 @@ async def delete_embedding_by_observation_id(
     Args:
         observation_id: The observation identifier
         main_db_engine: Async database engine
+        session: Optional caller-managed session; the delete joins its transaction and the caller commits
 
     Returns:
         True if deleted, False if not found
     """
-    session_maker = get_async_session_maker(main_db_engine)
+    async def _delete(session: AsyncSession) -> bool:
+        # NOTE: single DELETE ... RETURNING, no SELECT round trip or ORM load just to learn whether the row existed
+        stmt = (
+            delete(TextEmbeddingLogs)
+            .where(TextEmbeddingLogs.id == observation_id)
+            .returning(TextEmbeddingLogs.id)
+        )
+        deleted_id = (await session.execute(stmt)).scalar_one_or_none()
+
+        if deleted_id is not None:
+            logger.info(f"Deleted text embedding for observation {observation_id}")
+            return True
+        else:
+            logger.warning(f"No embedding found for observation {observation_id}")
+            return False
 
     try:
-        async with session_maker() as session:
-            stmt = select(TextEmbeddingLogs).where(TextEmbeddingLogs.id == observation_id)
-            result = await session.execute(stmt)
-            embedding = result.scalar_one_or_none()
-
-            if embedding:
-                await session.delete(embedding)
-                await session.commit()
-                logger.info(f"Deleted text embedding for observation {observation_id}")
-                return True
-            else:
-                logger.warning(f"No embedding found for observation {observation_id}")
-                return False
+        if session is not None:
+            return await _delete(session)
+        async with get_async_session_maker(main_db_engine)() as session, session.begin():
+            return await _delete(session)
     except Exception as e:
         logger.error(f"Failed to delete embedding: {e}")
         raise
@@ -3,10 +3,13 @@ from portable_brain.common.db.models.base import MainDB_Base
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy import String, Text, DateTime, Integer, Index, Computed
 from sqlalchemy.dialects.postgresql import TSVECTOR
-from pgvector.sqlalchemy import Vector
+from portable_brain.common.db.models.vector_types import BinaryHALFVEC
 from datetime import datetime
 from typing import Optional
 
+# leading characters of relationship_description covered by the full-text search_vector
+SEARCH_VECTOR_MAX_CHARS = 512
+
 
 class InterpersonalRelationship(MainDB_Base):
     """
@@ -87,12 +90,18 @@ class InterpersonalRelationship(MainDB_Base):
 
     # Dense embedding of relationship_description for semantic similarity search.
     # 1536 dimensions — matches gemini-embedding-001 / text-embedding-3-small.
-    relationship_vector: Mapped[list[float]] = mapped_column(Vector(1536), nullable=False)
+    # Stored as halfvec (fp16) to halve row and HNSW index size.
+    relationship_vector: Mapped[list[float]] = mapped_column(BinaryHALFVEC(1536), nullable=False)
 
-    # Full-text search on relationship_description
+    # Full-text search on the leading summary of relationship_description
+    # NOTE: only the first SEARCH_VECTOR_MAX_CHARS characters are tokenized, so the per-write to_tsvector cost is capped
+    # for long LLM-generated descriptions; the tokens are weighted 'A' so ts_rank favors them over any lower-weighted vectors.
     search_vector: Mapped[Optional[str]] = mapped_column(
         TSVECTOR,
-        Computed("to_tsvector('english', relationship_description)", persisted=True)
+        Computed(
+            f"setweight(to_tsvector('english', left(relationship_description, {SEARCH_VECTOR_MAX_CHARS})), 'A')",
+            persisted=True,
+        )
     )
 
     # --- Temporal metadata ---
@@ -121,7 +130,7 @@ class InterpersonalRelationship(MainDB_Base):
             'relationship_vector',
             postgresql_using='hnsw',
             postgresql_with={'m': 16, 'ef_construction': 64},
-            postgresql_ops={'relationship_vector': 'vector_cosine_ops'}
+            postgresql_ops={'relationship_vector': 'halfvec_cosine_ops'}
         ),
 
         # GIN index for full-text search on relationship descriptions.
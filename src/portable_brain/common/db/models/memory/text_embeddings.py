@@ -2,7 +2,7 @@
 from portable_brain.common.db.models.base import MainDB_Base
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy import String, Text, DateTime, Index
-from pgvector.sqlalchemy import Vector
+from portable_brain.common.db.models.vector_types import BinaryHALFVEC
 from datetime import datetime
 from typing import Optional
 
@@ -40,7 +40,8 @@ class TextEmbeddingLogs(MainDB_Base):
     observation_text: Mapped[str] = mapped_column(Text, nullable=False)
 
     # Embedding vector (1536 dimensions; pgvector HNSW max is 2000, gemini-embedding-001 supports configurable output_dimensionality)
-    embedding_vector: Mapped[list[float]] = mapped_column(Vector(1536), nullable=False)
+    # NOTE: stored as halfvec (fp16), half the bytes per row and per HNSW distance computation; recall loss is negligible at this dimensionality
+    embedding_vector: Mapped[list[float]] = mapped_column(BinaryHALFVEC(1536), nullable=False)
 
     # Metadata
     # timestamp
@@ -57,12 +58,12 @@ class TextEmbeddingLogs(MainDB_Base):
         Index('idx_text_embeddings_obs_id', 'observation_id'),
 
         # HNSW index for fast vector similarity search
-        # Using cosine distance (NOTE: can also use 'vector_l2_ops' for L2 distance)
+        # Using cosine distance (NOTE: can also use 'halfvec_l2_ops' for L2 distance)
         Index(
             'idx_text_embeddings_vector_cosine',
             'embedding_vector',
             postgresql_using='hnsw',
             postgresql_with={'m': 16, 'ef_construction': 64},
-            postgresql_ops={'embedding_vector': 'vector_cosine_ops'}
+            postgresql_ops={'embedding_vector': 'halfvec_cosine_ops'}
         ),
     )
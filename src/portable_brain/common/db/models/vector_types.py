@@ -0,0 +1,32 @@
+# column types for pgvector columns, tuned for the asyncpg driver
+from typing import Any
+from sqlalchemy import Dialect
+from pgvector import HalfVector
+from pgvector.sqlalchemy import HALFVEC
+
+class BinaryHALFVEC(HALFVEC):
+    """
+    HALFVEC column that hands bound values to asyncpg as-is, instead of pre-formatting them as '[0.1,0.2,...]' text.
+    - On asyncpg connections, register_vector_codecs() (see db/session.py) installs pgvector's binary codecs,
+      which encode list / ndarray values to the 2-bytes-per-dim wire format directly.
+    - Other drivers (e.g. psycopg2 in scripts/db) keep the stock text bind.
+    - Results always come back as list[float]: the asyncpg codec decodes halfvec to HalfVector, and on the locked pgvector (0.4.x)
+      the stock result processor passes HalfVector through as-is, so it's converted here (newer pgvector already returns lists).
+    """
+    cache_ok = True
+
+    def bind_processor(self, dialect: Dialect) -> Any:
+        if dialect.driver == "asyncpg":
+            return None
+        return super().bind_processor(dialect)
+
+    def result_processor(self, dialect: Dialect, coltype: Any) -> Any:
+        process = super().result_processor(dialect, coltype)
+
+        def to_list(value: Any) -> list[float] | None:
+            if process is not None:
+                value = process(value)
+            if isinstance(value, HalfVector):
+                return value.to_list()
+            return value
+        return to_list
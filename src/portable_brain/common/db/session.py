@@ -1,10 +1,14 @@
+import asyncio
+from sqlalchemy import text, event
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession, AsyncEngine
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
+from pgvector.asyncpg import register_vector
 from urllib.parse import quote_plus
 from pydantic import BaseModel
 from portable_brain.config.app_config import ServiceSettings
 from enum import Enum
+from weakref import WeakKeyDictionary
 from portable_brain.common.logging.logger import logger
 
 class DBSettings(BaseModel):
@@ -12,8 +16,8 @@ class DBSettings(BaseModel):
     Portable DB settings class used to pass in configs for generic Postgres connection.
     Provides validation layer for database configuration.
     """
-    POOL_SIZE: int = 5
-    MAX_OVERFLOW: int = 10
+    POOL_SIZE: int = 25
+    MAX_OVERFLOW: int = 25
     POOL_TIMEOUT: int = 30
     POOL_RECYCLE: int = 1800
     USER: str
@@ -89,6 +93,11 @@ async def create_db_engine_context(
         pool_pre_ping=True, # Verify connections before using them
     )
 
+    # binary pgvector codecs on every new asyncpg connection (see register_vector_codecs)
+    @event.listens_for(engine.sync_engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        dbapi_connection.run_async(register_vector_codecs)
+
     try:
         # Yield the engine for use within the 'async with' block in lifespan
         yield engine
@@ -96,14 +105,55 @@ async def create_db_engine_context(
         # Cleanup: dispose of the engine and close all connections
         await engine.dispose()
 
-def get_async_session_maker(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+async def register_vector_codecs(conn: Any) -> None:
     """
-    Creates a session maker factory for the given async engine.
+    Register pgvector's binary codecs (vector, halfvec, sparsevec) on a raw asyncpg connection.
+    - Vectors then travel as packed floats instead of '[0.1,0.2,...]' text that the server re-parses.
+    - The extension's schema is looked up rather than assumed, since it may live outside public (e.g. Supabase's "extensions").
+    - Does nothing if the extension isn't installed.
+    NOTE: vector columns must use BinaryHALFVEC, so SQLAlchemy doesn't pre-format bound values as text.
     """
-    return async_sessionmaker(
-        engine,
-        class_=AsyncSession, # explicitly declare type
-        expire_on_commit=False,
-        autoflush=False,
-        autocommit=False
+    schema = await conn.fetchval(
+        "SELECT n.nspname FROM pg_type t JOIN pg_namespace n ON n.oid = t.typnamespace WHERE t.typname = 'vector'"
     )
+    if schema is None:
+        logger.warning("pgvector extension not found, skipping binary vector codecs")
+        return
+    await register_vector(conn, schema=schema)
+
+async def prime_connection_pool(engine: AsyncEngine, connections: int) -> int:
+    """
+    Warm the engine's pool by opening `connections` connections concurrently and running SELECT 1 on each.
+    - Connections are checked out at the same time, so the pool ends up holding that many established connections.
+    - Returns the number of connections successfully primed; failures are logged, not raised.
+    """
+    async def _ping() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    results = await asyncio.gather(*(_ping() for _ in range(connections)), return_exceptions=True)
+    failures = [r for r in results if isinstance(r, BaseException)]
+    if failures:
+        logger.warning(f"Failed to prime {len(failures)}/{connections} DB connections: {failures[0]}")
+    return connections - len(failures)
+
+# one session maker per engine, shared by lifespan, dependencies, and every CRUD helper
+# NOTE: weak keys so a disposed engine (e.g. in scripts/tests) doesn't stay pinned by its maker
+_session_makers: "WeakKeyDictionary[AsyncEngine, async_sessionmaker[AsyncSession]]" = WeakKeyDictionary()
+
+def get_async_session_maker(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    """
+    Returns the session maker factory for the given async engine, building it on first use.
+    - The factory is cached per engine, so CRUD helpers that call this on every request reuse the same maker.
+    """
+    session_maker = _session_makers.get(engine)
+    if session_maker is None:
+        session_maker = async_sessionmaker(
+            engine,
+            class_=AsyncSession, # explicitly declare type
+            expire_on_commit=False,
+            autoflush=False,
+            autocommit=False
+        )
+        _session_makers[engine] = session_maker
+    return session_maker
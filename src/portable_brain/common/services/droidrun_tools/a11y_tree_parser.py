@@ -3,22 +3,28 @@ import re
 # NOTE: helper to parse the raw a11y tree into a more human-readable format without noise
 # used for LLM inference on actions without fragile guessing
 
-# patterns that indicate a quoted string is a resource ID / class name, not human-readable text
-_NOISE_PATTERNS = re.compile(
-    r'^(com\.|android\.|androidx\.|org\.)'
-)
-# patterns that look like internal UI identifiers (camelCase, snake_case, PascalCase dev labels)
-# e.g., "ConversationScreenUi", "message_list", "top_app_bar", "ComposeRowIcon:Shortcuts"
-_INTERNAL_ID_PATTERNS = re.compile(
-    r'^[a-z]+[A-Z]'          # camelCase: "monogramTest", "messageList"
-    r'|^[A-Z][a-z]+[A-Z]'   # PascalCase compound: "ConversationScreenUi", "GlideMonogram"
-    r'|^[a-z]+_[a-z]'       # snake_case: "message_list", "top_app_bar", "text_separator"
-    r'|^[A-Z]\w+:[A-Z]'     # PascalCase colon-separated: "ComposeRowIcon:Shortcuts", "Compose:Draft:Send"
+# quoted strings that are not human-readable text, as a single anchored alternation (one match attempt per string):
+# - resource IDs / class names: "com.instagram.android:id/row", "androidx.compose.ui"
+# - internal UI identifiers (camelCase, snake_case, PascalCase dev labels)
+#   e.g., "ConversationScreenUi", "message_list", "top_app_bar", "ComposeRowIcon:Shortcuts"
+_JUNK_PATTERNS = re.compile(
+    r'(?:com|android|androidx|org)\.'  # resource ID / class name prefixes
+    r'|[a-z]+[A-Z]'                    # camelCase: "monogramTest", "messageList"
+    r'|[A-Z][a-z]+[A-Z]'               # PascalCase compound: "ConversationScreenUi", "GlideMonogram"
+    r'|[a-z]+_[a-z]'                   # snake_case: "message_list", "top_app_bar", "text_separator"
+    r'|[A-Z]\w+:[A-Z]'                 # PascalCase colon-separated: "ComposeRowIcon:Shortcuts", "Compose:Draft:Send"
 )
+# quoted strings within a line
+_QUOTED_PATTERN = re.compile(r'"([^"]*)"')
+# element prefix, e.g. "24. Button: "
+_PREFIX_PATTERN = re.compile(r'^(\d+\.\s*\w+:\s*)')
+# trailing bounds info, e.g. "- (389,1990,1017,2053)"
+_BOUNDS_PATTERN = re.compile(r'\s*-\s*\(\d+,\d+,\d+,\d+\)\s*$')
 # generic action buttons that don't carry semantic value, so we can filter out this noise
-_GENERIC_ACTIONS = {
+# NOTE: lowercase keys, matched against the lowercased text key built once per line
+_GENERIC_ACTIONS = frozenset({
     "more options", "more actions", "action menu",
-}
+})
 
 def denoise_formatted_text(formatted_text: str, max_lines: int = 50) -> str:
     """
@@ -38,9 +44,19 @@ def denoise_formatted_text(formatted_text: str, max_lines: int = 50) -> str:
 
     lines = formatted_text.strip().split("\n")
     compressed = []
-    seen_text = set()  # track seen readable strings to deduplicate
+    seen_text = set()  # track seen readable strings (lowercased) to deduplicate
+    # NOTE: bound methods as locals, the loop below runs once per UI element
+    find_quoted = _QUOTED_PATTERN.findall
+    is_junk = _JUNK_PATTERNS.match
+    match_prefix = _PREFIX_PATTERN.match
+    strip_bounds = _BOUNDS_PATTERN.sub
 
     for line in lines:
+        # only the first max_lines kept lines are returned, so stop scanning once they're collected
+        # NOTE: on large screens this skips most of the tree; the header lines come first anyway
+        if len(compressed) == max_lines:
+            break
+
         # keep phone state header lines (app name, keyboard, focused element)
         if line.startswith("**") or line.startswith("•"):
             compressed.append(line)
@@ -51,42 +67,37 @@ def denoise_formatted_text(formatted_text: str, max_lines: int = 50) -> str:
             continue
 
         # extract all quoted strings from the line
-        quoted = re.findall(r'"([^"]*)"', line)
+        quoted = find_quoted(line)
         if not quoted:
             continue
 
         # separate readable text from resource IDs and internal UI identifiers
-        readable = [
-            q for q in quoted
-            if q
-            and not _NOISE_PATTERNS.match(q)
-            and not _INTERNAL_ID_PATTERNS.search(q)
-        ]
+        readable = [q for q in quoted if q and not is_junk(q)]
         if not readable:
             continue
 
+        # lowercased once, shared by the generic action check and the dedup key
+        text_key = tuple([q.lower() for q in readable])
+
         # skip generic action buttons
-        if len(readable) == 1 and readable[0].lower() in _GENERIC_ACTIONS:
+        if len(text_key) == 1 and text_key[0] in _GENERIC_ACTIONS:
             continue
 
-        # deduplicate by readable text content
-        text_key = tuple(readable)
+        # deduplicate by readable text content, case-insensitively ("Send" and "send" are the same element text)
         if text_key in seen_text:
             continue
         seen_text.add(text_key)
 
         # rebuild line: strip resource IDs from quoted strings, keep only readable text
         # extract the element prefix (e.g., "24. Button: ")
-        prefix_match = re.match(r'^(\d+\.\s*\w+:\s*)', line)
+        prefix_match = match_prefix(line)
         if prefix_match:
-            prefix = prefix_match.group(1)
-            readable_str = ", ".join(f'"{r}"' for r in readable)
-            cleaned = f"{prefix}{readable_str}"
-        else:
-            cleaned = line
+            # NOTE: rebuilt from the prefix and quoted strings only, so it already ends in a quote with no bounds to strip
+            compressed.append(prefix_match.group(1) + '"' + '", "'.join(readable) + '"')
+            continue
 
         # strip bounds info (e.g., "- (389,1990,1017,2053)")
-        cleaned = re.sub(r'\s*-\s*\(\d+,\d+,\d+,\d+\)\s*$', '', cleaned).strip()
+        cleaned = strip_bounds('', line).strip()
         if cleaned:
             compressed.append(cleaned)
 
@@ -1,3 +1,4 @@
+from dataclasses import dataclass, field
 from pydantic import BaseModel
 from typing import Optional
 from datetime import datetime
@@ -5,26 +6,33 @@ from datetime import datetime
 from portable_brain.monitoring.background_tasks.types.ui_states.ui_state import UIState
 from portable_brain.monitoring.background_tasks.types.ui_states.state_change_types import StateChangeType
 
-class RawExecutionResult(BaseModel):
+# NOTE: execution results are built internally once per DroidRun command from already-typed values, never parsed from untrusted input,
+# so they're plain slotted dataclasses instead of pydantic models: no validation pass on construction and a smaller per-instance footprint.
+# - kw_only keeps the keyword-only construction of the previous models.
+# - default_factory stamps each result at construction, instead of sharing one import-time timestamp.
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class RawExecutionResult:
     """
     Canonical representation of a bare, single DroidRun command execution result.
     Records the command, outcome, and before/after device state.
     - Thinly wraps around DroidRun's ResultEvent object fields with minimal metadata: timestamp and command
     """
-    timestamp: datetime = datetime.now()
+    timestamp: datetime = field(default_factory=datetime.now)
     command: str
     success: bool
     reason: Optional[str] = None
     steps: int
     structured_output: Optional[BaseModel] = None
 
-class ExecutionResult(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class ExecutionResult:
     """
     Canonical representation of a single DroidRun command execution result.
     Records the command, outcome, and before/after device state.
     - Wraps around DroidRun's ResultEvent object fields with enriched metadata like command + UI state diffs.
     """
-    timestamp: datetime = datetime.now()
+    timestamp: datetime = field(default_factory=datetime.now)
     command: str
     success: bool
     reason: Optional[str] = None
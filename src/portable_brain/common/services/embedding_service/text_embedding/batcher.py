@@ -0,0 +1,92 @@
+# micro-batcher that coalesces concurrent single-text embedding requests into one embedding API call
+
+import asyncio
+from typing import Optional
+from portable_brain.common.services.embedding_service.text_embedding.dispatcher import TypedTextEmbeddingClient
+from portable_brain.common.logging.logger import logger
+
+class EmbeddingMicroBatcher:
+    """
+    Collects texts submitted concurrently and embeds them in a single aembed_text call.
+    - A batch is flushed once it holds max_batch_size texts, or max_wait_s after its first text arrived, whichever comes first.
+    - Texts are batched per task_type, since one embedding call applies a single task type to all of its inputs.
+    - Each submitter awaits its own future; a failed batch call fails every submitter in that batch.
+
+    Usage:
+        batcher = EmbeddingMicroBatcher(typed_text_embedding_client)
+        vector = await batcher.submit("some text")
+    """
+    def __init__(
+        self,
+        client: TypedTextEmbeddingClient,
+        max_batch_size: int = 32,
+        max_wait_s: float = 0.005,
+    ):
+        self.client = client
+        self.max_batch_size = max_batch_size
+        self.max_wait_s = max_wait_s
+        # pending (text, future) pairs and their flush timers, keyed by task type
+        self._pending: dict[Optional[str], list[tuple[str, asyncio.Future[list[float]]]]] = {}
+        self._timers: dict[Optional[str], asyncio.TimerHandle] = {}
+        # batch calls currently in flight, kept referenced until done
+        self._inflight: set[asyncio.Task] = set()
+
+    async def submit(self, text: str, task_type: Optional[str] = None) -> list[float]:
+        """
+        Queue a single text for embedding and wait for its vector.
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[list[float]] = loop.create_future()
+        batch = self._pending.setdefault(task_type, [])
+        batch.append((text, future))
+
+        if len(batch) >= self.max_batch_size:
+            self._flush(task_type)
+        elif len(batch) == 1:
+            # first text of a new batch starts the wait window
+            self._timers[task_type] = loop.call_later(self.max_wait_s, self._flush, task_type)
+
+        return await future
+
+    def _flush(self, task_type: Optional[str]) -> None:
+        """
+        Hand the pending batch for task_type off to a background embedding call.
+        """
+        timer = self._timers.pop(task_type, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(task_type, None)
+        if not batch:
+            return
+        task = asyncio.ensure_future(self._embed_batch(batch, task_type))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
+    async def _embed_batch(self, batch: list[tuple[str, asyncio.Future[list[float]]]], task_type: Optional[str]) -> None:
+        """
+        Embed one batch and resolve each submitter's future with its vector.
+        NOTE: futures whose submitter already went away (cancelled request) are skipped.
+        """
+        try:
+            vectors = await self.client.aembed_text([text for text, _ in batch], task_type=task_type)
+            if len(vectors) != len(batch):
+                raise ValueError(f"Embedding batch returned {len(vectors)} vectors for {len(batch)} texts")
+        except Exception as e:
+            logger.error(f"Embedding batch of {len(batch)} texts failed: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), vector in zip(batch, vectors):
+            if not future.done():
+                future.set_result(vector)
+
+    async def aclose(self) -> None:
+        """
+        Flush any pending texts and wait for in-flight batch calls to finish.
+        """
+        for task_type in list(self._pending):
+            self._flush(task_type)
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
@@ -1,8 +1,11 @@
 # dispatcher for text embedding clients, currently only Google Gemini AI, but scalable to other LLM providers
 # NOTE: this generic LLM wrapper is not necessary right now since we only have Google Gemini for service.
 
+import hashlib
+from array import array
+from collections import OrderedDict
 from enum import Enum, auto
-from typing import Type, TypeVar
+from typing import Optional, Type, TypeVar
 from pydantic import BaseModel
 from portable_brain.common.services.embedding_service.text_embedding.protocols import TypedTextEmbeddingProtocol
 
@@ -13,16 +16,61 @@ class TextEmbeddingProvider(Enum):
     GOOGLE_GENAI = auto() # just need a unique identifier
 
 class TypedTextEmbeddingClient:
-    def __init__(self, provider: TextEmbeddingProvider, client: TypedTextEmbeddingProtocol):
+    """
+    Provider-agnostic text embedding wrapper with an in-process LRU cache of embedded texts.
+    - Cache keys are (task_type, sha256(text)), so identical texts re-embedded for the same task skip the API call.
+    - Vectors are cached as float32 arrays (same precision pgvector stores), ~6KB each at 1536 dims.
+      Fresh embeddings are rounded to float32 as well, so a text gets the same vector whether or not it was a cache hit.
+    - Pass use_cache=False to bypass the cache (e.g. latency tests).
+    - Raises ValueError if the provider returns a different number of vectors than texts (e.g. it dropped empty embeddings),
+      since the vectors could no longer be matched back to their texts.
+    """
+    def __init__(self, provider: TextEmbeddingProvider, client: TypedTextEmbeddingProtocol, cache_size: int = 4096):
         self.provider = provider
         self.client = client
+        self.cache_size = cache_size
+        self._cache: OrderedDict[tuple[Optional[str], bytes], array] = OrderedDict()
 
     async def aembed_text(
         self,
         text: list[str],
+        use_cache: bool = True,
         **kwargs
     ) -> list[list[float]]:
-        return await self.client.aembed_text(
-            text=text,
-            **kwargs
-        )
+        if not use_cache or self.cache_size <= 0:
+            embedded = await self.client.aembed_text(
+                text=text,
+                **kwargs
+            )
+            if len(embedded) != len(text):
+                raise ValueError(f"Expected {len(text)} embeddings, got {len(embedded)}")
+            return embedded
+
+        task_type = kwargs.get("task_type")
+        keys = [(task_type, hashlib.sha256(t.encode()).digest()) for t in text]
+        vectors: list[list[float] | None] = [None] * len(text)
+        misses: list[int] = []
+        for i, key in enumerate(keys):
+            cached = self._cache.get(key)
+            if cached is None:
+                misses.append(i)
+            else:
+                self._cache.move_to_end(key)
+                vectors[i] = cached.tolist()
+
+        if misses:
+            embedded = await self.client.aembed_text(
+                text=[text[i] for i in misses],
+                **kwargs
+            )
+            # NOTE: providers may drop empty embeddings, in which case results can't be matched back to their texts
+            if len(embedded) != len(misses):
+                raise ValueError(f"Expected {len(misses)} embeddings, got {len(embedded)}")
+            for i, vector in zip(misses, embedded):
+                cached = array("f", vector)
+                self._cache[keys[i]] = cached
+                vectors[i] = cached.tolist()
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+        return vectors  # type: ignore[return-value] # every slot is filled above
@@ -29,6 +29,7 @@ class AsyncGenAITextEmbeddingClient(TypedTextEmbeddingProtocol, ProvidesProvider
         embedding_size: int = 1536, # NOTE: use at max 1536 embeddings for now, since pgvector supports upto 2000 dims. Default is 3072, could be explored later.
         *,
         api_key: str | None = None,
+        client: genai.Client | None = None, # optionally share one genai.Client (and its connection pool) across clients
         retry_attempts: int = 2,
         retry_wait: float = 0.1,
         retry_on: type[Exception] = ValidationError, # only retry when LLM fails to meet Pydantic validation
@@ -36,7 +37,7 @@ class AsyncGenAITextEmbeddingClient(TypedTextEmbeddingProtocol, ProvidesProvider
         # Create shared client in __init__ for FastAPI (ASGI)
         # FastAPI runs in a single event loop, so sharing the client is safe and efficient
         # This enables connection pooling and reduces overhead compared to creating a new client per request
-        self.client = genai.Client(api_key=api_key)
+        self.client = client if client is not None else genai.Client(api_key=api_key)
         self.model_name = model_name
         self.content_type = content_type # content/task type to specialized embeddings
         self.embedding_size = embedding_size
@@ -1,7 +1,7 @@
 # The core async set up for Google's GenAI LLM client
 # NOTE: Can be swapped for different LLM providers if necessary
 
-from typing import Type, Any, Callable, Awaitable, Optional
+from typing import Type, Any, Callable, Awaitable, Optional, Mapping, AsyncIterator, Sequence
 from pydantic import BaseModel, ValidationError
 # use tenacity to retry when desired
 from tenacity import AsyncRetrying, stop_after_attempt, wait_fixed, retry_if_exception_type
@@ -12,6 +12,7 @@ from google.genai import types
 from .protocols import PydanticModel, TypedLLMProtocol, ProvidesProviderInfo
 from .protocols import RateLimitProvider
 import asyncio
+from dataclasses import is_dataclass, fields
 from concurrent.futures import ThreadPoolExecutor
 
 # logger to debug tool calling
@@ -29,6 +30,7 @@ class AsyncGenAITypedClient(TypedLLMProtocol, ProvidesProviderInfo):
         model_name: str = "gemini-3-flash-preview",
         *,
         api_key: str | None = None,
+        client: genai.Client | None = None, # optionally share one genai.Client (and its connection pool) across clients
         retry_attempts: int = 2,
         retry_wait: float = 0.1,
         retry_on: type[Exception] = ValidationError, # only retry when LLM fails to meet Pydantic validation
@@ -36,7 +38,7 @@ class AsyncGenAITypedClient(TypedLLMProtocol, ProvidesProviderInfo):
         # Create shared client in __init__ for FastAPI (ASGI)
         # FastAPI runs in a single event loop, so sharing the client is safe and efficient
         # This enables connection pooling and reduces overhead compared to creating a new client per request
-        self.client = genai.Client(api_key=api_key)
+        self.client = client if client is not None else genai.Client(api_key=api_key)
         self.model_name = model_name
         # Provider metadata for reporting
         self.provider = RateLimitProvider.GOOGLE
@@ -47,6 +49,9 @@ class AsyncGenAITypedClient(TypedLLMProtocol, ProvidesProviderInfo):
             retry=retry_if_exception_type(retry_on),
             reraise=True,
         )
+        # tools built from function declarations, keyed by id() of the declarations sequence
+        # NOTE: the sequence is kept alongside the tool so its id can't be reused while cached; callers should pass module-level constants
+        self._tool_cache: dict[int, tuple[Sequence[dict], types.Tool]] = {}
 
     async def acreate(
         self,
@@ -126,16 +131,60 @@ class AsyncGenAITypedClient(TypedLLMProtocol, ProvidesProviderInfo):
             return {k: self._make_serializable(v) for k, v in obj.items()}
         if isinstance(obj, (list, tuple)):
             return [self._make_serializable(item) for item in obj]
+        if is_dataclass(obj) and not isinstance(obj, type):
+            # NOTE: slotted dataclasses (e.g. RawExecutionResult) have no __dict__
+            return {f.name: self._make_serializable(getattr(obj, f.name)) for f in fields(obj)}
         if hasattr(obj, '__dict__'):
             return {k: self._make_serializable(v) for k, v in obj.__dict__.items() if not k.startswith('_')}
         return str(obj)
 
+    def _get_tool(self, function_declarations: Sequence[dict]) -> types.Tool:
+        """
+        Returns the Tool wrapping the given function declarations, validating them into a Tool only on first use.
+        Cached by identity, so the same declarations object is validated once per client.
+        """
+        cached = self._tool_cache.get(id(function_declarations))
+        if cached is not None and cached[0] is function_declarations:
+            return cached[1]
+        tool = types.Tool(function_declarations=list(function_declarations)) # type: ignore
+        self._tool_cache[id(function_declarations)] = (function_declarations, tool)
+        return tool
+
+    async def _dispatch_tool_call(
+        self,
+        tool_call: types.FunctionCall,
+        tool_executors: Mapping[str, Callable[..., Awaitable[Any]]],
+    ) -> types.Part:
+        """
+        Executes the LLM-requested tool call and wraps the result as a function response part.
+        Tool errors are sent back to the LLM so it can recover or explain.
+        """
+        tool_name = tool_call.name
+        tool_args = dict(tool_call.args) if tool_call.args else {}
+
+        if tool_name not in tool_executors:
+            raise ValueError(f"LLM requested unknown tool '{tool_name}'. Available: {list(tool_executors.keys())}")
+
+        # execute the tool
+        try:
+            result = await tool_executors[tool_name](**tool_args)
+            tool_response = {"result": self._make_serializable(result)}
+        except Exception as e:
+            # send the error back to the LLM so it can recover or explain
+            tool_response = {"error": str(e)}
+
+        # build the function response part
+        return types.Part.from_function_response(
+            name=tool_name, # type: ignore
+            response=tool_response,
+        )
+
     async def atool_call(
         self,
         system_prompt: str,
         user_prompt: str,
-        function_declarations: list[dict],
-        tool_executors: dict[str, Callable[..., Awaitable[Any]]],
+        function_declarations: Sequence[dict],
+        tool_executors: Mapping[str, Callable[..., Awaitable[Any]]],
         response_model: Optional[Type[PydanticModel]] = None,
         max_turns: int = 5,
         **kwargs,
@@ -149,7 +198,7 @@ class AsyncGenAITypedClient(TypedLLMProtocol, ProvidesProviderInfo):
         NOTE: no tenacity retryer yet; to be implemented as an inner loop wrapper.
         """
         # wrap function declarations in tool and config objects
-        tools = types.Tool(function_declarations=function_declarations) # type: ignore
+        tools = self._get_tool(function_declarations)
 
         # NOTE: it is possible to optionally add pydantic schema here, but this might cause competitinng output goals for LLM.
         # disallowed until future experiments
@@ -214,26 +263,8 @@ class AsyncGenAITypedClient(TypedLLMProtocol, ProvidesProviderInfo):
                 return text
 
             # LLM requested a tool call, dispatch to the appropriate executor
-            tool_name = tool_call.name
-            tool_args = dict(tool_call.args) if tool_call.args else {}
-            logger.info(f"[atool_call] Turn {_turn + 1}: LLM called '{tool_name}' with args: {tool_args}")
-
-            if tool_name not in tool_executors:
-                raise ValueError(f"LLM requested unknown tool '{tool_name}'. Available: {list(tool_executors.keys())}")
-
-            # execute the tool
-            try:
-                result = await tool_executors[tool_name](**tool_args)
-                tool_response = {"result": self._make_serializable(result)}
-            except Exception as e:
-                # send the error back to the LLM so it can recover or explain
-                tool_response = {"error": str(e)}
-
-            # build the function response part
-            function_response_part = types.Part.from_function_response(
-                name=tool_name,
-                response=tool_response,
-            )
+            logger.info(f"[atool_call] Turn {_turn + 1}: LLM called '{tool_call.name}' with args: {dict(tool_call.args) if tool_call.args else {}}")
+            function_response_part = await self._dispatch_tool_call(tool_call, tool_executors)
 
             # append model's tool call + our execution result to conversation history
             contents.append(response_content) # type: ignore
@@ -247,3 +278,89 @@ class AsyncGenAITypedClient(TypedLLMProtocol, ProvidesProviderInfo):
         raise RuntimeError(
             f"atool_call() exhausted {max_turns} turns without receiving a final text response from LLM."
         )
+
+    async def atool_call_stream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        function_declarations: Sequence[dict],
+        tool_executors: Mapping[str, Callable[..., Awaitable[Any]]],
+        max_turns: int = 5,
+        **kwargs,
+    ) -> AsyncIterator[str]:
+        """
+        Streaming variant of atool_call().
+        Tool calls are resolved the same way, but the final text response is yielded in chunks as the LLM decodes it.
+
+        NOTE: no response_model validation here; the caller receives raw text chunks and parses the joined output if needed.
+
+        Streaming contract:
+        - A turn's text is yielded as it arrives, until a function_call part shows up in that turn; later text in a tool call turn is held back.
+        - The first turn that yields any text is the final turn. If the LLM emits a function_call after that turn's text was
+          already streamed, the tool call is logged and not executed, and the stream ends there.
+          So the joined chunks are always a single turn's text, never a preamble followed by another turn's answer.
+        """
+        tools = self._get_tool(function_declarations)
+        config = types.GenerateContentConfig(
+            system_instruction=system_prompt,
+            tools=[tools],
+        )
+        contents: list[types.Content] = [
+            types.Content(
+                role="user", parts=[types.Part(text=user_prompt)]
+            )
+        ]
+
+        for _turn in range(max_turns):
+            # on the last turn, remove tools to force a text response
+            turn_config = config
+            if _turn == max_turns - 1:
+                logger.warning(f"[atool_call_stream] Turn {_turn + 1}/{max_turns}: last turn, removing tools to force text response")
+                turn_config = types.GenerateContentConfig(
+                    system_instruction=system_prompt,
+                )
+
+            stream = await self.client.aio.models.generate_content_stream(
+                model=self.model_name,
+                contents=contents, # type: ignore
+                config=turn_config,
+            )
+
+            # collect all parts of this turn (needed to replay a tool call turn), and yield text as it arrives
+            response_parts: list[types.Part] = []
+            tool_call: Optional[types.FunctionCall] = None
+            streamed_text = False
+            async for chunk in stream:
+                chunk_content = chunk.candidates[0].content if chunk.candidates else None
+                if not chunk_content or not chunk_content.parts:
+                    continue
+                response_parts.extend(chunk_content.parts)
+                for part in chunk_content.parts:
+                    if tool_call is None and part.function_call is not None:
+                        tool_call = part.function_call
+                if tool_call is None:
+                    text = "".join(part.text for part in chunk_content.parts if part.text)
+                    if text:
+                        streamed_text = True
+                        yield text
+
+            if streamed_text:
+                # NOTE: this turn's text has already been streamed out as the final response (see streaming contract above)
+                if tool_call is not None:
+                    logger.warning(f"[atool_call_stream] Turn {_turn + 1}: ignoring tool call '{tool_call.name}' emitted after streamed text")
+                return
+
+            if tool_call is None or tool_call.name is None:
+                # LLM responded with neither text nor a usable tool call
+                return
+
+            logger.info(f"[atool_call_stream] Turn {_turn + 1}: LLM called '{tool_call.name}' with args: {dict(tool_call.args) if tool_call.args else {}}")
+            function_response_part = await self._dispatch_tool_call(tool_call, tool_executors)
+
+            # append model's tool call + our execution result to conversation history
+            contents.append(types.Content(role="model", parts=response_parts))
+            contents.append(types.Content(role="user", parts=[function_response_part]))
+
+        raise RuntimeError(
+            f"atool_call_stream() exhausted {max_turns} turns without receiving a final text response from LLM."
+        )
@@ -65,6 +65,7 @@ class ServiceSettings(
 
     # orchestrator settings
     orchestrator_max_iterations: int = 3
+    orchestrator_iteration_timeout_s: float = 120.0 # wall-time bound per retrieval/execution step
 
     # execution agent settings
     execution_agent_max_turns: int = 5
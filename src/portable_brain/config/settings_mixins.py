@@ -7,10 +7,13 @@ class MainDBSettingsMixin(BaseModel):
     """
     Model for common SQLAlchemy connection pool settings.
     """
-    MAIN_DB_POOL_SIZE: int = Field(default=5, description="Number of connections to keep in the pool.")
-    MAIN_DB_MAX_OVERFLOW: int = Field(default=10, description="Max 'overflow' connections beyond pool_size.")
+    # NOTE: async pools stop scaling when undersized under concurrent load; 25-50 total connections is the sweet spot
+    # keep pool_size + max_overflow under the Postgres/Supabase connection limit when overriding via env
+    MAIN_DB_POOL_SIZE: int = Field(default=25, description="Number of connections to keep in the pool.")
+    MAIN_DB_MAX_OVERFLOW: int = Field(default=25, description="Max 'overflow' connections beyond pool_size.")
     MAIN_DB_POOL_TIMEOUT: int = Field(default=30, description="Seconds to wait before giving up on getting a connection.")
     MAIN_DB_POOL_RECYCLE: int = Field(default=1800, description="Recycle connections after this many seconds.")
+    MAIN_DB_PRIME_POOL: bool = Field(default=True, description="Open pool_size connections at startup so the first requests skip connection setup.")
     
     MAIN_DB_USER: str
     MAIN_DB_PW: str
@@ -1,67 +1,94 @@
 from typing import Any, Optional
 from portable_brain.common.logging.logger import logger
 from fastapi import Request, Depends
-from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 from portable_brain.common.services.llm_service.llm_client import TypedLLMClient, TypedLLMProtocol
 from portable_brain.common.services.embedding_service.text_embedding import TypedTextEmbeddingClient
+from portable_brain.common.services.embedding_service.text_embedding.batcher import EmbeddingMicroBatcher
 from portable_brain.common.services.llm_service.llm_client.google_genai_client import AsyncGenAITypedClient
 from portable_brain.common.services.droidrun_tools import DroidRunClient
 from portable_brain.monitoring.background_tasks.observation_tracker import ObservationTracker
 from portable_brain.agent_service.execution_agent.agent import ExecutionAgent
 from portable_brain.agent_service.retrieval_agent.agent import RetrievalAgent
+from portable_brain.agent_service.orchestrator.main_orchestrator import MainOrchestrator
 from portable_brain.memory.main_retriever import MemoryRetriever
 
 # This is the location to conveniently return any app lifetime dependencies to be used in routes
+# NOTE: getters are async def on purpose; FastAPI runs sync dependencies through the anyio threadpool,
+# which would cost a thread hop (and a limiter token) per dependency per request just to read app.state
 # TODO: add more dependencies as needed
-def get_main_db_engine(request: Request) -> AsyncEngine:
+async def get_main_db_engine(request: Request) -> AsyncEngine:
     """
     FastAPI dependency to get the shared main DB engine from the application state.
     """
     return request.app.state.main_db_engine
 
-def get_gemini_llm_client(request: Request) -> TypedLLMClient:
+async def get_main_session_maker(request: Request) -> async_sessionmaker[AsyncSession]:
+    """
+    FastAPI dependency to get the shared main DB session maker from the application state.
+    """
+    return request.app.state.main_session_maker
+
+async def get_gemini_llm_client(request: Request) -> TypedLLMClient:
     """
     FastAPI dependency to get the shared Google GenAI LLM client from the application state.
     """
     return request.app.state.gemini_llm_client
 
-def get_nova_llm_client(request: Request) -> TypedLLMClient:
+async def get_nova_llm_client(request: Request) -> TypedLLMClient:
     """
     FastAPI dependency to get the shared Amazon Nova LLM client from the application state.
     """
     return request.app.state.nova_llm_client
 
-def get_droidrun_client(request: Request) -> DroidRunClient:
+async def get_droidrun_client(request: Request) -> DroidRunClient:
     """
     FastAPI dependency to get the shared DroidRun SDK client from the application state.
     """
     return request.app.state.droidrun_client
 
-def get_observation_tracker(request: Request) -> ObservationTracker:
+async def get_observation_tracker(request: Request) -> ObservationTracker:
     """
     FastAPI dependency to get the shared observation tracker from the application state.
     """
     return request.app.state.observation_tracker
 
-def get_gemini_text_embedding_client(request: Request) -> TypedTextEmbeddingClient:
+async def get_gemini_text_embedding_client(request: Request) -> TypedTextEmbeddingClient:
     """
     FastAPI dependency to get the shared Google Gen AI text embedding client from the application state.
     """
     return request.app.state.gemini_text_embedding_client
 
-def get_execution_agent(request: Request) -> ExecutionAgent:
+async def get_embedding_batcher(request: Request) -> EmbeddingMicroBatcher:
+    """
+    FastAPI dependency to get the shared embedding micro-batcher from the application state.
+    """
+    return request.app.state.embedding_batcher
+
+async def get_execution_agent(request: Request) -> ExecutionAgent:
     """
     FastAPI dependency to get the shared execution agent from the application state.
     """
     return request.app.state.execution_agent
 
-def get_retrieval_agent(request: Request) -> RetrievalAgent:
+async def get_retrieval_agent(request: Request) -> RetrievalAgent:
     """
     FastAPI dependency to get the shared retrieval agent from the application state.
     """
     return request.app.state.retrieval_agent
 
-def get_memory_retriever(request: Request) -> MemoryRetriever:
+async def get_main_orchestrator(
+    execution_agent: ExecutionAgent = Depends(get_execution_agent),
+    retrieval_agent: RetrievalAgent = Depends(get_retrieval_agent),
+) -> MainOrchestrator:
+    """
+    FastAPI dependency to get a main orchestrator wired to the shared agents.
+    NOTE: request-scoped on purpose; the orchestrator holds per-run state (retrieval log, tool call cache, in-flight tasks),
+    so a shared instance would mix concurrent runs. Construction is only attribute assignment, the agents are the shared part.
+    """
+    return MainOrchestrator(execution_agent, retrieval_agent)
+
+async def get_memory_retriever(request: Request) -> MemoryRetriever:
     """
     FastAPI dependency to get the shared memory retriever from the application state.
     """
@@ -1,13 +1,15 @@
 from contextlib import asynccontextmanager, AsyncExitStack
 from fastapi import FastAPI
+from google import genai
 from portable_brain.config.app_config import get_service_settings
 from portable_brain.common.logging.logger import logger
-from portable_brain.common.db.session import create_db_engine_context, parse_db_settings_from_service, DBSettings, DBType
+from portable_brain.common.db.session import create_db_engine_context, parse_db_settings_from_service, get_async_session_maker, prime_connection_pool, DBSettings, DBType
 from portable_brain.common.services.llm_service.llm_client import TypedLLMClient, TypedLLMProtocol, LLMProvider
 from portable_brain.common.services.embedding_service.text_embedding import TypedTextEmbeddingClient, TextEmbeddingProvider
 from portable_brain.common.services.llm_service.llm_client.google_genai_client import AsyncGenAITypedClient
 from portable_brain.common.services.llm_service.llm_client.amazon_nova_client import AsyncAmazonNovaTypedClient
 from portable_brain.common.services.embedding_service.text_embedding.gemini_embedding_client import AsyncGenAITextEmbeddingClient
+from portable_brain.common.services.embedding_service.text_embedding.batcher import EmbeddingMicroBatcher
 from portable_brain.common.services.droidrun_tools import DroidRunClient
 from portable_brain.monitoring.background_tasks.observation_tracker import ObservationTracker
 from portable_brain.agent_service.execution_agent.agent import ExecutionAgent
@@ -44,11 +46,19 @@ async def lifespan(app: FastAPI):
                 db_settings=main_db_settings
             )
         )
+        # session maker for the main db, built once and shared by routes
+        app.state.main_session_maker = get_async_session_maker(app.state.main_db_engine)
         logger.info("Main database engine initialized.")
+        if settings.MAIN_DB_PRIME_POOL:
+            primed = await prime_connection_pool(app.state.main_db_engine, main_db_settings.POOL_SIZE)
+            logger.info(f"Primed {primed} main database connections.")
+
+        # shared Google GenAI client, so LLM and embedding calls (incl. memory retriever tool calls) reuse one connection pool
+        gemini_client = genai.Client(api_key=settings.GOOGLE_GENAI_API_KEY)
 
         # LLM clients (no need for resource clean up)
         # NOTE: for now, only Google GenAI and Amazon NOVA clients
-        gemini_llm_client = AsyncGenAITypedClient(api_key=settings.GOOGLE_GENAI_API_KEY)
+        gemini_llm_client = AsyncGenAITypedClient(client=gemini_client)
         # wrap around GenAI client for management
         typed_gemini_llm_client = TypedLLMClient(provider=LLMProvider.GOOGLE_GENAI, client=gemini_llm_client)
         app.state.gemini_llm_client = typed_gemini_llm_client
@@ -61,10 +71,13 @@ async def lifespan(app: FastAPI):
         logger.info(f"LLM client (AMAZON NOVA) initialized.")
 
         # Text embedding models, for now only Google GenAI
-        gemini_text_embedding_client = AsyncGenAITextEmbeddingClient(api_key=settings.GOOGLE_GENAI_API_KEY)
+        gemini_text_embedding_client = AsyncGenAITextEmbeddingClient(client=gemini_client)
         typed_gemini_text_embedding_client = TypedTextEmbeddingClient(provider=TextEmbeddingProvider.GOOGLE_GENAI, client=gemini_text_embedding_client)
         app.state.gemini_text_embedding_client = typed_gemini_text_embedding_client
         logger.info(f"Text embedding client (GOOGLE GENAI) initialized.")
+        # coalesces concurrent single-text embedding requests into batched calls
+        app.state.embedding_batcher = EmbeddingMicroBatcher(client=typed_gemini_text_embedding_client)
+        stack.push_async_callback(app.state.embedding_batcher.aclose)
 
         # DroidRun SDK client (uses same Google GenAI LLM via load_llm)
         droidrun_client = DroidRunClient(api_key=settings.GOOGLE_GENAI_API_KEY)
@@ -117,6 +130,12 @@ async def lifespan(app: FastAPI):
         app.state.retrieval_agent = retrieval_agent
         logger.info(f"Retrieval agent initialized.")
 
+        # build the OpenAPI schema now, so the first docs request doesn't pay for walking every route's models
+        # NOTE: FastAPI caches it on app.openapi_schema; docs are only served when INCLUDE_DOCS is set
+        if settings.INCLUDE_DOCS:
+            app.openapi()
+            logger.info(f"OpenAPI schema pre-built.")
+
         try:
             # lets FastAPI process requests during yield
             yield
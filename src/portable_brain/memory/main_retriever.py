@@ -12,7 +12,7 @@ from portable_brain.common.services.embedding_service.text_embedding.dispatcher
 from portable_brain.common.logging.logger import logger
 
 # data structures for caches
-from collections import OrderedDict, deque
+from collections import OrderedDict
 
 # structured memory fetch operations
 from portable_brain.common.db.crud.memory.structured_memory_crud import (
@@ -44,7 +44,7 @@ class MemoryRetriever():
 
     Caches:
     1. Exact match cache - skips embedding client entirely on identical query texts (LRU via OrderedDict, max 50)
-    2. Semantic cache — skips db retrieval if a sufficiently similar query was seen before (FIFO deque, max 10)
+    2. Semantic cache — skips db retrieval if a sufficiently similar query was seen before (FIFO ring buffer, max 10)
     NOTE: only supported by find_semantically_similar for now, to be implemented for other methods
     - one caveat is if the memory is updated after the query, the cache may become stale; future TBD
 
@@ -56,7 +56,12 @@ class MemoryRetriever():
         self.text_embedding_client = text_embedding_client
         # caches to reduce latency, for text embedding logs
         self._exact_cache: OrderedDict[str, list[str]] = OrderedDict()
-        self._semantic_cache: deque[tuple[list[float], list[str]]] = deque(maxlen=10) # query_vector, results tuple
+        # semantic cache as a ring buffer: one row of unit-normalized float32 query vectors per slot, results kept alongside by slot
+        # NOTE: the vector matrix is allocated on first insert, once the embedding dimension is known
+        self._semantic_cache_max = 10
+        self._semantic_cache_vectors: Optional[np.ndarray] = None
+        self._semantic_cache_results: list[list[str]] = []
+        self._semantic_cache_next = 0 # next slot to write, oldest entry once the buffer is full
         self._cosine_similarity_threshold = 0.70 # threshold for semantic cache
         self._exact_cache_max = 50 # threshold for max number of items in exact query cache
         # exact name cache for find_person_by_name (keyed on normalized lowercase name)
@@ -258,7 +263,7 @@ class MemoryRetriever():
         if disable_cache:
             # for testing, just skips cache logic entirely
             logger.info(f"Skipping cache for query: {query}")
-            query_vectors = await self.text_embedding_client.aembed_text(text=[query], task_type="RETRIEVAL_QUERY")
+            query_vectors = await self.text_embedding_client.aembed_text(text=[query], task_type="RETRIEVAL_QUERY", use_cache=False)
             if not query_vectors:
                 logger.warning(f"Failed to embed query: {query}, returning empty list")
                 return []
@@ -285,9 +290,9 @@ class MemoryRetriever():
         query_vector = query_vectors[0]
 
         # 2) semantic cache — skip db retrieval if similar query was seen before
-        # NOTE: current helper loops through all the cached vectors, but it is possible to implement this via numpy matrix multiplication to one-shot all cosine similarities
-        # - above optimization not yet implemented since cache size is negligibly small (most case) and may be beneficial if recent cache computed first and returns
-        semantic_cache_result = self._find_semantic_cache_hit(query_vector)
+        # query is normalized once, so all cached similarities come from a single matrix-vector product
+        query_unit = self._unit_vector(query_vector)
+        semantic_cache_result = self._find_semantic_cache_hit(query_unit) if query_unit is not None else None
         if semantic_cache_result:
             logger.info(f"Semantic cache hit: {query}")
             # NOTE: if we have a semantic cache hit, we also promote to exact cache w/ similar vector results (not exact)
@@ -303,7 +308,8 @@ class MemoryRetriever():
             distance_metric=distance_metric
         )
         self._set_exact_cache(query, results)
-        self._semantic_cache.append((query_vector, results))
+        if query_unit is not None:
+            self._set_semantic_cache(query_unit, results)
         return results
 
     async def get_embedding_for_observation(
@@ -329,25 +335,46 @@ class MemoryRetriever():
         if len(self._exact_cache) > self._exact_cache_max:
             self._exact_cache.popitem(last=False) # evict LRU
 
-    def _cosine_similarity(self, a: list[float], b: list[float]) -> float:
+    def _unit_vector(self, vector: list[float]) -> Optional[np.ndarray]:
         """
-        Simple helper to compute cosine similarity between two vectors using numpy.
-        Returns 0.0 if either vector has zero norm (undefined similarity).
+        Simple helper to L2-normalize a vector into a float32 numpy array.
+        Returns None if the vector has zero norm (undefined similarity).
         """
-        va, vb = np.array(a), np.array(b)
-        norm_a, norm_b = np.linalg.norm(va), np.linalg.norm(vb)
-        if norm_a == 0.0 or norm_b == 0.0:
-            return 0.0
-        return float(np.dot(va, vb) / (norm_a * norm_b))
+        v = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(v)
+        if norm == 0.0:
+            return None
+        return v / norm
 
-    def _find_semantic_cache_hit(self, query_vector: list[float]) -> Optional[list[str]]:
+    def _set_semantic_cache(self, query_unit: np.ndarray, results: list[str]) -> None:
         """
-        Simple helper to loop through semantic cache to find query hit via cos. sim. threshold.
-        - Iterates newest-first so a more recent cached result is preferred over an older one.
-        - If cache hit, returns just the cached similar text results
+        Simple helper to insert into the semantic cache ring buffer, overwriting the oldest slot if at capacity (FIFO).
+        """
+        if self._semantic_cache_vectors is None:
+            self._semantic_cache_vectors = np.empty((self._semantic_cache_max, query_unit.shape[0]), dtype=np.float32)
+        slot = self._semantic_cache_next
+        self._semantic_cache_vectors[slot] = query_unit
+        if slot < len(self._semantic_cache_results):
+            self._semantic_cache_results[slot] = results
+        else:
+            self._semantic_cache_results.append(results)
+        self._semantic_cache_next = (slot + 1) % self._semantic_cache_max
+
+    def _find_semantic_cache_hit(self, query_unit: np.ndarray) -> Optional[list[str]]:
+        """
+        Simple helper to find a semantic cache hit via cos. sim. threshold.
+        - Cached vectors and the query are pre-normalized, so cosine similarities are one matrix-vector product over the filled slots.
+        - Returns the results of the most similar cached query, if it clears the threshold.
         - returns None if no semantic cache hit
         """
-        for cached_vector, cached_results in reversed(self._semantic_cache):
-            if self._cosine_similarity(query_vector, cached_vector) >= self._cosine_similarity_threshold:
-                return cached_results
+        filled = len(self._semantic_cache_results)
+        if self._semantic_cache_vectors is None or filled == 0:
+            return None
+        if self._semantic_cache_vectors.shape[1] != query_unit.shape[0]:
+            # embedding dimension changed (e.g. provider swap), cached vectors aren't comparable
+            return None
+        similarities = self._semantic_cache_vectors[:filled] @ query_unit
+        best = int(np.argmax(similarities))
+        if float(similarities[best]) >= self._cosine_similarity_threshold:
+            return self._semantic_cache_results[best]
         return None
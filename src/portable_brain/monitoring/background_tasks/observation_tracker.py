@@ -40,6 +40,7 @@ from portable_brain.monitoring.embedding_manager.text_embeddings.generate_embedd
 
 # data structrue to track only recent information
 from collections import deque
+from itertools import islice
 # async engine for db
 from sqlalchemy.ext.asyncio import AsyncEngine
 from portable_brain.common.db.session import get_async_session_maker
@@ -81,6 +82,16 @@ class ObservationTracker(ObservationRepository):
         # store recent state changes as a queue w/ max length of 10 to avoid too much memory
         self.recent_state_changes: deque[UIStateChange] = deque(maxlen=10)
 
+        # bumped on every change to the histories above, so readers can tell whether a previous read is still current
+        self.version: int = 0
+
+        # observations waiting to be persisted by the background worker, drained in batches
+        # NOTE: the worker is started lazily on first enqueue, so the tracker can be built outside a running event loop
+        self.persist_batch_size: int = 16
+        self.persist_max_wait_s: float = 0.05
+        self._persist_queue: asyncio.Queue[Observation] = asyncio.Queue()
+        self._persist_task: Optional[asyncio.Task] = None
+
         # observation helper
         self.inferencer = ObservationInferencer(droidrun_client=self.droidrun_client, llm_client=self.llm_client, main_db_engine=self.main_db_engine)
         # embedding helper NOTE: embedding client is not a core dependency of observation tracker.
@@ -105,6 +116,7 @@ class ObservationTracker(ObservationRepository):
                     # track of the most recent state changes
                     # NOTE: automatically maintained via deque
                     self.recent_state_changes.append(change)
+                    self.version += 1
                     logger.info(f"Detected state change: {change.change_type}")
 
                     # construct a UIStateSnapshot DTO from the detected change
@@ -150,6 +162,7 @@ class ObservationTracker(ObservationRepository):
                     
                     logger.info(f"Recording new snapshot from activity: {snapshot.activity.activity_name}, package: {snapshot.package}")
                     self.state_snapshots.append(snapshot)
+                    self.version += 1
                     self.snapshot_counter += 1
                     # per-app tracking: initialize deque on first snapshot for this package
                     pkg = snapshot.package
@@ -229,6 +242,7 @@ class ObservationTracker(ObservationRepository):
             # there is a meaningful observation to update, so update local history and return None
             logger.info(f"Updated observation from recent snapshots: {updated_observation.node}")
             self.observations[-1] = updated_observation # replace last observation w/ updated
+            self.version += 1
             return None
         
         # TODO: load in existing nodes by semantic similarity and update or make edges
@@ -251,12 +265,84 @@ class ObservationTracker(ObservationRepository):
             # logger.info(f"Successfully saved old observation to STRUCTURED MEMORY: {old_observation.node}")
 
             # also saves to text log (semantic vector db) NOTE: this logic might be temporary.
-            # we also use a convenience wrapper that handles both embedding generation and saving; should separate in future.
-            await self.embedding_generator.generate_and_save_embedding(observation_id=old_observation.id, observation_text=old_observation.node)
-            logger.info(f"Successfully saved old observation to TEXT LOG: {old_observation.node}")
+            # queued for the background persist worker, so callers don't wait on the embedding call and DB commit
+            self._enqueue_persist(old_observation)
         # saves new observation to local history
         self.observations.append(new_observation)
+        self.version += 1
             
+    def _enqueue_persist(self, observation: Observation) -> None:
+        """
+        Queue an observation for persistence by the background worker, starting the worker if needed.
+        """
+        if self._persist_task is None or self._persist_task.done():
+            self._persist_task = asyncio.create_task(self._persist_worker())
+        self._persist_queue.put_nowait(observation)
+
+    async def _persist_worker(self) -> None:
+        """
+        Drains the persist queue in batches and saves each batch to the text log.
+        - A batch is whatever is queued persist_max_wait_s after its first observation arrived, up to persist_batch_size.
+        - Each batch is embedded in one embedding call and saved in one insert.
+        - If the batch fails (e.g. one duplicate id fails the whole insert), its observations are retried one at a time,
+          so only the observations that fail on their own are dropped; the worker keeps running either way.
+        """
+        while True:
+            batch = [await self._persist_queue.get()]
+            # let concurrent evictions (e.g. replays) land in the same batch
+            await asyncio.sleep(self.persist_max_wait_s)
+            while len(batch) < self.persist_batch_size:
+                try:
+                    batch.append(self._persist_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            try:
+                # NOTE: uses a convenience wrapper that handles both embedding generation and saving; should separate in future.
+                await self.embedding_generator.generate_and_save_embeddings(
+                    [(observation.id, observation.node) for observation in batch]
+                )
+                logger.info(f"Successfully saved {len(batch)} observations to TEXT LOG")
+            except Exception as e:
+                logger.error(f"Failed to save {len(batch)} observations to TEXT LOG: {e}")
+                if len(batch) > 1:
+                    await self._persist_individually(batch)
+            finally:
+                for _ in batch:
+                    self._persist_queue.task_done()
+
+    async def _persist_individually(self, batch: list[Observation]) -> None:
+        """
+        Fallback for a failed persist batch: saves each observation on its own, so one bad row doesn't lose the rest.
+        NOTE: texts the failed batch already embedded are served from the embedding client's cache.
+        """
+        saved = 0
+        for observation in batch:
+            try:
+                await self.embedding_generator.generate_and_save_embedding(
+                    observation_id=observation.id,
+                    observation_text=observation.node
+                )
+                saved += 1
+            except Exception as e:
+                logger.error(f"Failed to save observation {observation.id} to TEXT LOG: {e}")
+        logger.info(f"Saved {saved}/{len(batch)} observations to TEXT LOG individually after batch failure")
+
+    async def flush_persist_queue(self) -> None:
+        """
+        Wait until every queued observation has been persisted, then stop the persist worker.
+        NOTE: the worker restarts on the next enqueue, so this is safe to call outside of shutdown.
+        """
+        if self._persist_task is None:
+            return
+        if not self._persist_task.done():
+            await self._persist_queue.join()
+            self._persist_task.cancel()
+            try:
+                await self._persist_task
+            except asyncio.CancelledError:
+                pass # Expected
+        self._persist_task = None
+
     def get_state_snapshots(
         self,
         limit: Optional[int] = None,
@@ -271,14 +357,8 @@ class ObservationTracker(ObservationRepository):
         Returns:
             List of UIStateSnapshot DTOs, most recent first.
         """
-        snapshots = list(self.state_snapshots)
-
-        if limit:
-            snapshots = snapshots[-limit:]
-
-        snapshots.reverse() # make the first snapshot the most recent
-
-        return snapshots
+        # walk the deque from the most recent end, copying only the requested snapshots
+        return list(islice(reversed(self.state_snapshots), limit or None))
 
     def get_observations(
         self,
@@ -292,18 +372,10 @@ class ObservationTracker(ObservationRepository):
             limit: Max observations to return
 
         Returns:
-            List of observations
-            NOTE: the bottom index in returned list is the most recent. Possibly reverse indices to fetch most recent on top.
+            List of observations, most recent first.
         """
-        observations = list(self.observations)
-
-        # optional filtering by number of observations limit
-        if limit:
-            observations = observations[-limit:]
-        
-        observations.reverse() # make the first observation the most recent
-
-        return observations
+        # walk the deque from the most recent end, copying only the requested observations
+        return list(islice(reversed(self.observations), limit or None))
     
     def get_state_changes(
         self,
@@ -343,6 +415,7 @@ class ObservationTracker(ObservationRepository):
     def clear_observations(self):
         """Clear observation history after persisting to DB."""
         self.observations.clear()
+        self.version += 1
 
     def clear_state_snapshots(self):
         """
@@ -353,10 +426,12 @@ class ObservationTracker(ObservationRepository):
         self.app_snapshots.clear()
         self.app_snapshot_counters.clear()
         self.snapshot_counter = 0
+        self.version += 1
 
     def clear_state_changes(self):
         """Clear state change history after persisting to DB."""
         self.recent_state_changes.clear()
+        self.version += 1
 
     # helper to monitor states of tracker
     def get_monitoring_overview(self):
@@ -442,16 +517,12 @@ class ObservationTracker(ObservationRepository):
         # Then flush the remaining observation
         if self.observations:
             last_observation = self.observations[-1]
-            # NOTE: this uses a convenience wrapper that handles both embedding generation and saving
+            # NOTE: goes through the persist queue like every other observation
             # if we want to save to more than just the text log, should handle that here too.
-            try:
-                await self.embedding_generator.generate_and_save_embedding(
-                    observation_id=last_observation.id,
-                    observation_text=last_observation.node
-                )
-                logger.info(f"Flushed last observation to TEXT LOG on shutdown: {last_observation.node}")
-            except Exception as e:
-                logger.error(f"Failed to flush last observation on shutdown: {e}")
+            self._enqueue_persist(last_observation)
+            logger.info(f"Queued last observation for TEXT LOG on shutdown: {last_observation.node}")
+        # wait for everything queued so far (including the above) to be written before clearing state
+        await self.flush_persist_queue()
 
         # clear all internal states of previous tracking
         self.clear_observations()
@@ -487,6 +558,7 @@ class ObservationTracker(ObservationRepository):
         # loop over snapshots, and add each to the local snapshot history.
         for snapshot in state_snapshots:
             self.state_snapshots.append(snapshot)
+            self.version += 1
             self.snapshot_counter += 1
             pkg = snapshot.package
             if pkg not in self.app_snapshots:
@@ -510,11 +582,9 @@ class ObservationTracker(ObservationRepository):
         # NOTE: add more saving logic here if we want more than just text log
         if self.observations:
             last_observation = self.observations[-1]
-            await self.embedding_generator.generate_and_save_embedding(
-                observation_id=last_observation.id,
-                observation_text=last_observation.node
-            )
-            logger.info(f"Flushed last observation to TEXT LOG on replay end: {last_observation.node}")
+            # NOTE: persisted in the background; replay returns once observations are generated
+            self._enqueue_persist(last_observation)
+            logger.info(f"Queued last observation for TEXT LOG on replay end: {last_observation.node}")
 
         if previous_running:
             # resume tracking if previously running, using last poll interval
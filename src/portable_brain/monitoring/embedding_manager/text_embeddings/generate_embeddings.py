@@ -2,7 +2,7 @@
 import uuid
 from typing import Optional
 from portable_brain.monitoring.embedding_manager.embedding_repository import EmbeddingRepository
-from portable_brain.common.db.crud.memory.text_embeddings_crud import save_text_embedding_log
+from portable_brain.common.db.crud.memory.text_embeddings_crud import save_text_embedding_log, save_text_embedding_logs
 from portable_brain.common.db.crud.memory.people_crud import save_person_relationship
 from portable_brain.common.logging.logger import logger
 
@@ -61,6 +61,39 @@ class EmbeddingGenerator(EmbeddingRepository):
         logger.info(f"Generated and saved embedding for observation {observation_id}")
         return embedding_vector
 
+    async def generate_and_save_embeddings(
+        self,
+        observations: list[tuple[str, str]],
+    ) -> list[list[float]]:
+        """
+        Batch variant of generate_and_save_embedding.
+
+        Args:
+            observations: List of (observation_id, observation_text) pairs
+
+        Returns:
+            The embedding vectors, in input order
+
+        NOTE: all texts are embedded in a single embedding call, and all rows are saved in a single batched insert.
+        - Raises ValueError if the embedding call doesn't return one vector per observation, rather than saving misaligned rows.
+        """
+        if not observations:
+            return []
+        embeddings = await self.embedding_client.aembed_text([text for _, text in observations])
+        if len(embeddings) != len(observations):
+            raise ValueError(f"Expected {len(observations)} embeddings, got {len(embeddings)}")
+
+        await save_text_embedding_logs(
+            [
+                (observation_id, observation_text, embedding_vector)
+                for (observation_id, observation_text), embedding_vector in zip(observations, embeddings)
+            ],
+            main_db_engine=self.main_db_engine,
+        )
+
+        logger.info(f"Generated and saved embeddings for {len(observations)} observations")
+        return embeddings
+
     async def generate_and_save_person_embedding(
         self,
         first_name: str,